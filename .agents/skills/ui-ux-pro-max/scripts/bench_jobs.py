@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bulk Generation Benchmark - scaling of `search.py --bulk --jobs N` from 1 to N cores
+
+Usage:
+    python bench_jobs.py [--projects 200] [--pages 4] [--max-jobs 8] [--json]
+
+Builds a synthetic manifest from products.csv (one project per product type,
+repeated as needed), then times generate_bulk(force=True) into a fresh temp
+directory for jobs = 1, 2, 4, ... up to --max-jobs. Output ordering is
+checked to be identical for every job count.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+from core import DATA_DIR, RowStore, preload_indexes
+from design_system import generate_bulk
+
+
+# ============ CONFIGURATION ============
+PAGES = ["dashboard", "landing", "checkout", "settings", "pricing", "blog"]
+
+
+def build_manifest(projects: int, pages: int) -> dict:
+    """One project per product type (cycled), each with the first `pages` page names."""
+    products = RowStore.from_csv(DATA_DIR / "products.csv")
+    manifest = {"projects": []}
+    for i in range(projects):
+        idx = i % len(products)
+        keywords = str(products.value(idx, "Keywords")).split(",")[:2]
+        manifest["projects"].append({
+            "name": f"Bench {i:04d}",
+            "query": " ".join([products.value(idx, "Product Type"), *keywords]),
+            "pages": PAGES[:pages],
+        })
+    return manifest
+
+
+def job_counts(max_jobs: int) -> list:
+    counts, jobs = [], 1
+    while jobs < max_jobs:
+        counts.append(jobs)
+        jobs *= 2
+    return counts + [max_jobs]
+
+
+def run_benchmark(projects: int, pages: int, max_jobs: int) -> dict:
+    manifest = build_manifest(projects, pages)
+    preload_indexes()  # every job count starts from the same warm parent
+    runs, baseline, order = [], None, None
+    for jobs in job_counts(max_jobs):
+        with tempfile.TemporaryDirectory() as output_dir:
+            report = generate_bulk(manifest, output_dir, force=True, jobs=jobs)
+        names = [project["project"] for project in report["projects"]]
+        if order is None:
+            order = names
+        elif names != order:
+            raise AssertionError(f"Output order changed with jobs={jobs}")
+        baseline = baseline or report["seconds"]
+        runs.append({
+            "jobs": jobs,
+            "seconds": report["seconds"],
+            "speedup": round(baseline / report["seconds"], 2),
+            "efficiency": round(baseline / report["seconds"] / jobs, 2),
+        })
+    return {
+        "python": sys.version.split()[0],
+        "cpus": os.cpu_count(),
+        "projects": projects,
+        "pages_per_project": pages,
+        "runs": runs,
+    }
+
+
+def format_report(report: dict) -> str:
+    lines = [f"## Bulk generation scaling ({report['projects']} projects x {report['pages_per_project']} pages, "
+             f"{report['cpus']} CPUs)", ""]
+    lines.append(f"{'jobs':>5}{'seconds':>10}{'speedup':>10}{'efficiency':>12}")
+    for run in report["runs"]:
+        lines.append(f"{run['jobs']:>5}{run['seconds']:>10.3f}{run['speedup']:>9.2f}x{run['efficiency']:>12.2f}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk generation --jobs scaling benchmark")
+    parser.add_argument("--projects", type=int, default=200, help="Projects in the synthetic manifest (default: 200)")
+    parser.add_argument("--pages", type=int, default=4, choices=range(len(PAGES) + 1), help="Pages per project (default: 4)")
+    parser.add_argument("--max-jobs", type=int, default=os.cpu_count() or 1, help="Largest job count (default: CPU count)")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+    if args.projects < 1 or args.max_jobs < 1:
+        parser.error("--projects and --max-jobs must be at least 1")
+
+    report = run_benchmark(args.projects, args.pages, args.max_jobs)
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
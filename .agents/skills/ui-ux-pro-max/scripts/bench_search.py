@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Search Benchmark - index build, query latency, batch throughput, design-system
+latency and peak memory of the search engine, on the real data and on
+synthetic corpora scaled up from the same CSV schemas
+
+Usage:
+    python bench_search.py [--scales 1,10,100] [--repeat 5] [--engine python] [--json] [-o results.json]
+
+Scale 1 is data/ as shipped. Scale N writes every CSV with N times its rows
+into a temp directory: the original rows, then rows whose cells are drawn
+(seeded) from the same column of random original rows, so vocabulary and
+field lengths keep their real distribution. Indexes are built into a temp
+directory too, so the user's cache is never touched. The JSON report carries
+the data fingerprint to compare runs across data updates.
+"""
+
+import argparse
+import csv
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import core
+import design_system
+from core import (CSV_CONFIG, STACK_CONFIG, RowStore, build_index, data_fingerprint, index_cache_clear,
+                  preload_indexes, search, search_all, search_batch, search_stack, set_search_engine)
+
+
+# ============ CONFIGURATION ============
+SEED = 1234
+QUERIES_PER_DOMAIN = 20
+DESIGN_QUERIES = ["SaaS dashboard", "e-commerce luxury", "fintech crypto dark", "healthcare app accessible",
+                  "portfolio minimal", "restaurant booking", "gaming neon", "education platform playful"]
+
+
+# ============ SYNTHETIC CORPORA ============
+def scale_csv(source: Path, target: Path, scale: int, rng: random.Random) -> int:
+    """Write source with `scale` times its rows to target; returns the row count."""
+    with open(source, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        columns = reader.fieldnames
+        rows = list(reader)
+    out = list(rows)
+    for _ in range(len(rows) * (scale - 1)):
+        out.append({col: rng.choice(rows)[col] for col in columns})
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with open(target, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(out)
+    return len(out)
+
+
+def make_corpus(source_dir: Path, data_dir: Path, scale: int) -> None:
+    """Scaled copy of every CSV under source_dir, with the same relative paths."""
+    rng = random.Random(SEED)
+    for source in sorted(source_dir.rglob("*.csv")):
+        scale_csv(source, data_dir / source.relative_to(source_dir), scale, rng)
+
+
+def use_data_dir(data_dir: Path, index_dir: Path) -> None:
+    """Point search and design-system generation at another data/index directory."""
+    core.DATA_DIR = design_system.DATA_DIR = data_dir
+    core.INDEX_DIR = index_dir
+    index_cache_clear()
+
+
+# ============ MEASUREMENTS ============
+def _timed(fn, repeat: int) -> list:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _per_call(fn, args: list, repeat: int) -> dict:
+    """Latency summary over `repeat` timed calls of fn(*arg) for every arg."""
+    samples = []
+    for arg in args:
+        samples += _timed(lambda: fn(*arg), repeat)
+    return _summary(samples)
+
+
+def _summary(samples: list) -> dict:
+    samples = sorted(samples)
+    return {
+        "median_ms": round(statistics.median(samples), 4),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 4),
+        "mean_ms": round(statistics.fmean(samples), 4),
+    }
+
+
+def _peak_mb(fn) -> float:
+    """Peak traced Python allocation while running fn, in MB."""
+    tracemalloc.start()
+    try:
+        fn()
+        return round(tracemalloc.get_traced_memory()[1] / 1024 / 1024, 2)
+    finally:
+        tracemalloc.stop()
+
+
+def sample_queries() -> dict:
+    """Per domain: short queries taken from the first search columns of evenly spaced rows."""
+    queries = {}
+    for domain, config in CSV_CONFIG.items():
+        rows = RowStore.from_csv(core.DATA_DIR / config["file"])
+        step = max(1, len(rows) // QUERIES_PER_DOMAIN)
+        queries[domain] = [" ".join(rows.document(idx, config["search_cols"][:2]).split()[:4])
+                           for idx in range(0, len(rows), step)][:QUERIES_PER_DOMAIN]
+    return queries
+
+
+def bench_build(repeat: int) -> dict:
+    """Median index build time per CSV (parse + fit + write)."""
+    results = {}
+    for filepath, search_cols, field_weights in core._dataset_targets():
+        samples = _timed(lambda: build_index(filepath, search_cols, field_weights), repeat)
+        results[filepath.relative_to(core.DATA_DIR).as_posix()] = {
+            "rows": len(build_index(filepath, search_cols, field_weights)["rows"]),
+            **_summary(samples),
+        }
+    return results
+
+
+def bench_queries(queries: dict, repeat: int) -> dict:
+    """Warm single-query latency per domain, for stacks, auto-detection and federated search."""
+    preload_indexes()
+    flat = [query for domain_queries in queries.values() for query in domain_queries]
+    results = {domain: _per_call(search, [(query, domain) for query in domain_queries], repeat)
+               for domain, domain_queries in queries.items()}
+    stack_args = [(query, stack) for stack in STACK_CONFIG for query in flat[::len(queries)]]
+    results["stack"] = _per_call(search_stack, stack_args, repeat)
+    results["auto_domain"] = _per_call(search, [(query,) for query in flat], repeat)
+    results["all_domains"] = _per_call(search_all, [(query,) for query in flat], repeat)
+    return results
+
+
+def bench_batch(queries: dict, repeat: int) -> dict:
+    """search_batch throughput over every sampled query of every domain."""
+    requests = [(domain, query, core.MAX_RESULTS) for domain, domain_queries in queries.items() for query in domain_queries]
+    search_batch(requests)
+    median_ms = statistics.median(_timed(lambda: search_batch(requests), repeat))
+    return {"queries": len(requests), "median_ms": round(median_ms, 3),
+            "queries_per_sec": round(len(requests) / median_ms * 1000, 1)}
+
+
+def bench_design_system(repeat: int) -> dict:
+    """Uncached generation latency: with a warm generator, and including generator setup."""
+    generator = design_system.DesignSystemGenerator()
+    return {
+        "generate": _per_call(generator.generate, [(query,) for query in DESIGN_QUERIES], repeat),
+        "generator_setup_and_generate": _summary(
+            _timed(lambda: design_system.DesignSystemGenerator().generate(DESIGN_QUERIES[0]), repeat)),
+    }
+
+
+def bench_memory() -> dict:
+    """Peak traced allocation for building, loading and using the indexes."""
+    build_mb = _peak_mb(lambda: [build_index(*target) for target in core._dataset_targets()])
+    index_cache_clear()
+    load_mb = _peak_mb(preload_indexes)
+    generate_mb = _peak_mb(lambda: design_system.DesignSystemGenerator().generate(DESIGN_QUERIES[0]))
+    return {"build_all_mb": build_mb, "load_all_mb": load_mb, "design_system_mb": generate_mb}
+
+
+def bench_scale(scale: int, repeat: int, workdir: Path, original: Path, queries: dict) -> dict:
+    data_dir = original
+    if scale > 1:
+        data_dir = workdir / f"data-x{scale}"
+        make_corpus(original, data_dir, scale)
+    use_data_dir(data_dir, workdir / f"index-x{scale}")
+
+    build = bench_build(repeat)
+    return {
+        "scale": scale,
+        "rows": sum(result["rows"] for result in build.values()),
+        "data_fingerprint": data_fingerprint(),
+        "build": build,
+        "query": bench_queries(queries, repeat),
+        "batch": bench_batch(queries, repeat),
+        "design_system": bench_design_system(repeat),
+        "memory": bench_memory(),
+    }
+
+
+def run_benchmark(scales: list, repeat: int, engine: str) -> dict:
+    set_search_engine(engine)
+    original = core.DATA_DIR
+    original_index = core.INDEX_DIR
+    # Same queries at every scale, so latencies are comparable
+    queries = sample_queries()
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            results = [bench_scale(scale, repeat, Path(workdir), original, queries) for scale in scales]
+    finally:
+        use_data_dir(original, original_index)
+    return {
+        "python": sys.version.split()[0],
+        "engine": engine,
+        "repeat": repeat,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "scales": results,
+    }
+
+
+def format_report(report: dict) -> str:
+    lines = [f"## Search benchmark (Python {report['python']}, engine {report['engine']}, {report['repeat']} repeats)"]
+    for result in report["scales"]:
+        lines.append("")
+        lines.append(f"### x{result['scale']} ({result['rows']} rows)")
+        build_ms = sum(item["median_ms"] for item in result["build"].values())
+        slowest = max(result["build"].items(), key=lambda item: item[1]["median_ms"])
+        lines.append(f"- Index build: {build_ms:.1f}ms total, slowest {slowest[0]} {slowest[1]['median_ms']:.1f}ms")
+        for name, latency in result["query"].items():
+            lines.append(f"- Query {name}: {latency['median_ms']:.3f}ms median, {latency['p95_ms']:.3f}ms p95")
+        lines.append(f"- Batch: {result['batch']['queries']} queries in {result['batch']['median_ms']:.1f}ms "
+                     f"({result['batch']['queries_per_sec']:.0f}/s)")
+        lines.append(f"- Design system: {result['design_system']['generate']['median_ms']:.2f}ms warm, "
+                     f"{result['design_system']['generator_setup_and_generate']['median_ms']:.2f}ms with setup")
+        memory = result["memory"]
+        lines.append(f"- Peak memory: build {memory['build_all_mb']}MB, load {memory['load_all_mb']}MB, "
+                     f"design system {memory['design_system_mb']}MB")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Search engine benchmark")
+    parser.add_argument("--scales", type=str, default="1,10,100", help="Comma-separated corpus multipliers (default: 1,10,100)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repetitions per measurement (default: 5)")
+    parser.add_argument("--engine", choices=core.SEARCH_ENGINES, default=core.SEARCH_ENGINE, help="Scoring engine")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--output", "-o", type=str, default=None, help="Also write the JSON report to this file")
+    args = parser.parse_args()
+
+    scales = [int(scale) for scale in args.scales.split(",") if scale.strip()]
+    if not scales or min(scales) < 1:
+        parser.error("--scales must be positive integers")
+
+    report = run_benchmark(scales, args.repeat, args.engine)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Startup Benchmark - cold invocation latency of search.py, as felt by agent hooks
+
+Usage:
+    python bench_startup.py [--runs 15] [--budget-ms 75] [--json]
+
+Every scenario runs as a fresh process. Reports median/p90 wall time, the
+overhead over a bare interpreter, and the heaviest top-level imports from a
+`python -X importtime` run. Runs use a temporary UIPRO_CACHE_DIR (indexes are
+built there by the warm-up run), so the user's cache is never read or written;
+the design-system scenario passes --no-cache to time real generation. Exits
+with status 1 when the plain domain search overhead exceeds the budget.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+# ============ CONFIGURATION ============
+SCRIPTS_DIR = Path(__file__).parent
+STARTUP_BUDGET_MS = 75  # domain search overhead over `python -c pass`
+TOP_IMPORTS = 8
+
+SCENARIOS = {
+    "interpreter": ["-c", "pass"],
+    "domain": ["search.py", "glassmorphism dark", "--domain", "style", "--no-daemon"],
+    "stack": ["search.py", "form validation", "--stack", "react", "--no-daemon"],
+    "design_system": ["search.py", "SaaS dashboard", "--design-system", "--no-cache"],
+}
+
+
+def _env(cache_dir: str) -> dict:
+    """Child environment; bytecode caching stays on so we measure real cold starts."""
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["UIPRO_CACHE_DIR"] = cache_dir
+    return env
+
+
+def _run(args: list, cache_dir: str, extra: list = ()) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *extra, *args], cwd=SCRIPTS_DIR, env=_env(cache_dir),
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+
+
+def time_scenario(args: list, runs: int, cache_dir: str) -> dict:
+    """Median and p90 wall time of `runs` fresh invocations, in ms."""
+    _run(args, cache_dir)  # warm-up: writes .pyc files and compiled indexes
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        _run(args, cache_dir)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "median_ms": round(statistics.median(samples), 2),
+        "p90_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.9))], 2),
+    }
+
+
+def import_profile(args: list, cache_dir: str) -> dict:
+    """Total and heaviest top-level imports from one `-X importtime` run, in ms."""
+    stderr = _run(args, cache_dir, ["-X", "importtime"]).stderr
+    top_level = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Nested imports are indented below their parent
+        if not name[1:].startswith(" "):
+            top_level.append((name.strip(), int(cumulative) / 1000))
+    top_level.sort(key=lambda x: x[1], reverse=True)
+    return {
+        "total_ms": round(sum(ms for _, ms in top_level), 2),
+        "top": [[name, round(ms, 2)] for name, ms in top_level[:TOP_IMPORTS]],
+    }
+
+
+def run_benchmark(runs: int) -> dict:
+    with tempfile.TemporaryDirectory() as cache_dir:
+        scenarios = {name: time_scenario(args, runs, cache_dir) for name, args in SCENARIOS.items()}
+        imports = {name: import_profile(args, cache_dir) for name, args in SCENARIOS.items() if name != "interpreter"}
+    baseline = scenarios["interpreter"]["median_ms"]
+    for name, result in scenarios.items():
+        result["overhead_ms"] = round(result["median_ms"] - baseline, 2)
+    return {
+        "python": sys.version.split()[0],
+        "runs": runs,
+        "scenarios": scenarios,
+        "imports": imports,
+    }
+
+
+def format_report(report: dict) -> str:
+    lines = [f"## search.py startup (Python {report['python']}, {report['runs']} runs)", ""]
+    lines.append(f"{'scenario':<15}{'median':>10}{'p90':>10}{'overhead':>10}")
+    for name, result in report["scenarios"].items():
+        lines.append(f"{name:<15}{result['median_ms']:>8.1f}ms{result['p90_ms']:>8.1f}ms{result['overhead_ms']:>8.1f}ms")
+    for name, profile in report["imports"].items():
+        lines.append("")
+        lines.append(f"### Imports: {name} ({profile['total_ms']:.1f}ms top-level)")
+        for module, ms in profile["top"]:
+            lines.append(f"- {module}: {ms:.1f}ms")
+    lines.append("")
+    lines.append(f"Budget: domain overhead {report['scenarios']['domain']['overhead_ms']:.1f}ms / {report['budget_ms']}ms "
+                 f"-> {'OK' if report['within_budget'] else 'OVER BUDGET'}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="search.py startup benchmark")
+    parser.add_argument("--runs", type=int, default=15, help="Invocations per scenario (default: 15)")
+    parser.add_argument("--budget-ms", type=float, default=STARTUP_BUDGET_MS, help=f"Allowed domain search overhead (default: {STARTUP_BUDGET_MS})")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.runs)
+    report["budget_ms"] = args.budget_ms
+    report["within_budget"] = report["scenarios"]["domain"]["overhead_ms"] <= args.budget_ms
+
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+    sys.exit(0 if report["within_budget"] else 1)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Search Client - forwards CLI searches to a running search server
+
+Kept deliberately light: it is imported on every search.py invocation, so
+socket and json are only imported once a server socket actually exists.
+"""
+
+import os
+import stat
+import zlib
+from core import DATA_DIR
+
+
+# ============ CONFIGURATION ============
+# One socket per user and per skill install, so a server never answers from another data dir
+_INSTALL_KEY = f"{zlib.crc32(str(DATA_DIR.resolve()).encode('utf-8')):08x}"
+_RUNTIME_DIR = os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR") or "/tmp"
+SOCKET_PATH = os.environ.get("UIPRO_SOCKET") or os.path.join(
+    _RUNTIME_DIR, f"ui-ux-pro-max-{getattr(os, 'getuid', lambda: 0)()}-{_INSTALL_KEY}.sock")
+CONNECT_TIMEOUT = 0.2
+REQUEST_TIMEOUT = 30
+
+
+def _owned_socket(socket_path: str) -> bool:
+    """True when socket_path is a socket owned by the current user.
+
+    The default path may be in a shared /tmp, where another local user could
+    create the socket first and answer every search.
+    """
+    try:
+        st = os.lstat(socket_path)
+    except OSError:
+        return False
+    if not stat.S_ISSOCK(st.st_mode):
+        return False
+    return not hasattr(os, "getuid") or st.st_uid == os.getuid()
+
+
+def forward(request: dict, socket_path: str = SOCKET_PATH):
+    """Send a request to a running server; returns None when none is reachable or trusted."""
+    if not _owned_socket(socket_path):
+        return None
+
+    import json
+    import socket
+
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(socket_path)
+            sock.settimeout(REQUEST_TIMEOUT)
+            sock.sendall((json.dumps(request, ensure_ascii=False) + "\n").encode("utf-8"))
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+    except OSError:
+        return None
+
+    if not line:
+        return None
+    try:
+        return json.loads(line.decode("utf-8"))
+    except json.JSONDecodeError:
+        return None
+
+
+def ping(socket_path: str = SOCKET_PATH) -> bool:
+    """True when a server answers on socket_path."""
+    response = forward({"op": "ping"}, socket_path)
+    return bool(response and response.get("ok"))
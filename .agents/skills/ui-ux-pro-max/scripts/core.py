@@ -4,20 +4,45 @@
 UI/UX Pro Max Core - BM25 search engine for UI/UX style guides
 """
 
-import csv
+import heapq
+import os
+import pickle
 import re
+import sys
+import threading
+import zlib
 from pathlib import Path
 from math import log
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, deque
+from functools import lru_cache
 
 # ============ CONFIGURATION ============
 DATA_DIR = Path(__file__).parent.parent / "data"
 MAX_RESULTS = 3
 
+# Compiled BM25 indexes live outside the skill so read-only installs still work
+CACHE_DIR = Path(os.environ.get("UIPRO_CACHE_DIR") or Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "ui-ux-pro-max")
+INDEX_DIR = CACHE_DIR / "index"
+INDEX_VERSION = 5
+
+# Tokenizer used for every index build; stored indexes record it and rebuild on change
+TOKENIZER_OPTIONS = {"min_length": 3, "stopwords": (), "stem": False}
+
+# Scoring engine: "python" (default) or "numpy" (falls back to python without NumPy)
+SEARCH_ENGINE = os.environ.get("UIPRO_SEARCH_ENGINE", "python")
+SEARCH_ENGINES = ("python", "numpy")
+
+# In-process index cache budget: entry count and summed source CSV size. The size
+# budget is not a memory bound; a fitted index takes roughly 10-15x its CSV size
+INDEX_CACHE_MAX_ENTRIES = 32
+INDEX_CACHE_MAX_SOURCE_BYTES = 64 * 1024 * 1024
+
 CSV_CONFIG = {
     "style": {
         "file": "styles.csv",
         "search_cols": ["Style Category", "Keywords", "Best For", "Type", "AI Prompt Keywords"],
+        # BM25F weight per search column, or (weight, b) to also tune its length normalisation
+        "field_weights": {"Style Category": 3.0, "Keywords": 2.0, "Best For": 1.5, "Type": 1.0, "AI Prompt Keywords": (0.5, 0.9)},
         "output_cols": ["Style Category", "Type", "Keywords", "Primary Colors", "Effects & Animation", "Best For", "Performance", "Accessibility", "Framework Compatibility", "Complexity", "AI Prompt Keywords", "CSS/Technical Keywords", "Implementation Checklist", "Design System Variables"]
     },
     "color": {
@@ -86,133 +111,694 @@ STACK_CONFIG = {
 # Common columns for all stacks
 _STACK_COLS = {
     "search_cols": ["Category", "Guideline", "Description", "Do", "Don't"],
+    "field_weights": {"Category": 2.0, "Guideline": 3.0, "Description": 1.0, "Do": 0.75, "Don't": 0.75},
     "output_cols": ["Category", "Guideline", "Description", "Do", "Don't", "Code Good", "Code Bad", "Severity", "Docs URL"]
 }
 
 AVAILABLE_STACKS = list(STACK_CONFIG.keys())
 
+# Auto-detection keywords per domain, matched as substrings of the lowercased query
+DOMAIN_KEYWORDS = {
+    "color": ["color", "palette", "hex", "#", "rgb"],
+    "chart": ["chart", "graph", "visualization", "trend", "bar", "pie", "scatter", "heatmap", "funnel"],
+    "landing": ["landing", "page", "cta", "conversion", "hero", "testimonial", "pricing", "section"],
+    "product": ["saas", "ecommerce", "e-commerce", "fintech", "healthcare", "gaming", "portfolio", "crypto", "dashboard"],
+    "style": ["style", "design", "ui", "minimalism", "glassmorphism", "neumorphism", "brutalism", "dark mode", "flat", "aurora", "prompt", "css", "implementation", "variable", "checklist", "tailwind"],
+    "ux": ["ux", "usability", "accessibility", "wcag", "touch", "scroll", "animation", "keyboard", "navigation", "mobile"],
+    "typography": ["font", "typography", "heading", "serif", "sans"],
+    "icons": ["icon", "icons", "lucide", "heroicons", "symbol", "glyph", "pictogram", "svg icon"],
+    "react": ["react", "next.js", "nextjs", "suspense", "memo", "usecallback", "useeffect", "rerender", "bundle", "waterfall", "barrel", "dynamic import", "rsc", "server component"],
+    "web": ["aria", "focus", "outline", "semantic", "virtualize", "autocomplete", "form", "input type", "preconnect"]
+}
+
+
+# ============ ROW STORE ============
+class RowStore:
+    """CSV rows as value tuples sharing one header; dicts are built only for results"""
+
+    __slots__ = ("columns", "positions", "rows")
+
+    def __init__(self, columns, rows):
+        self.columns = tuple(sys.intern(col) for col in columns)
+        # Later duplicates win, matching csv.DictReader
+        self.positions = {col: pos for pos, col in enumerate(self.columns)}
+        self.rows = rows
+
+    @classmethod
+    def from_csv(cls, filepath):
+        """Read a CSV; short rows are padded with None like csv.DictReader"""
+        import csv  # only needed when (re)building an index
+
+        with open(filepath, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            columns = next(reader, [])
+            width = len(columns)
+            rows = [tuple(values[:width]) if len(values) >= width else tuple(values) + (None,) * (width - len(values))
+                    for values in reader if values]
+        return cls(columns, rows)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getstate__(self):
+        return self.columns, self.rows
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    def value(self, idx, col, default=""):
+        """Single cell, or default when the column does not exist"""
+        pos = self.positions.get(col)
+        return default if pos is None else self.rows[idx][pos]
+
+    def document(self, idx, cols):
+        """Search text for a row: the given columns joined by spaces"""
+        return " ".join(str(self.value(idx, col)) for col in cols)
+
+    def materialize(self, idx, cols):
+        """Dict of the given columns that exist, in the given order"""
+        values = self.rows[idx]
+        positions = self.positions
+        return {col: values[positions[col]] for col in cols if col in positions}
+
+
+# ============ TOKENIZER ============
+class Tokenizer:
+    """Lowercase, split on non-word characters, filter short words and stopwords"""
+
+    PATTERN = re.compile(r'\w+')
+    QUERY_CACHE_SIZE = 1024
+
+    def __init__(self, min_length=3, stopwords=(), stem=False):
+        self.min_length = min_length
+        self.stopwords = frozenset(stopwords)
+        self.stem = stem
+        # Queries repeat far more than documents, so only they are cached
+        self.tokenize_query = lru_cache(maxsize=self.QUERY_CACHE_SIZE)(self._tokenize_query)
+
+    def config(self):
+        """Options that affect the produced terms (recorded in stored indexes)"""
+        return {
+            "pattern": self.PATTERN.pattern,
+            "min_length": self.min_length,
+            "stopwords": sorted(self.stopwords),
+            "stem": self.stem,
+        }
+
+    def __getstate__(self):
+        return {"min_length": self.min_length, "stopwords": tuple(self.stopwords), "stem": self.stem}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def _stem(self, word):
+        """Light plural stemming: 'categories' -> 'category', 'forms' -> 'form'"""
+        if len(word) > 4 and word.endswith("ies"):
+            return word[:-3] + "y"
+        if len(word) > 3 and word.endswith("s") and not word.endswith(("ss", "us", "is")):
+            return word[:-1]
+        return word
+
+    def tokenize(self, text):
+        """Terms of a document, interned so the index shares one string per term"""
+        words = self.PATTERN.findall(str(text).lower())
+        if self.stem:
+            words = [self._stem(w) for w in words]
+        min_length, stopwords = self.min_length, self.stopwords
+        return [sys.intern(w) for w in words if len(w) >= min_length and w not in stopwords]
+
+    def _tokenize_query(self, text):
+        return tuple(self.tokenize(text))
+
 
 # ============ BM25 IMPLEMENTATION ============
 class BM25:
     """BM25 ranking algorithm for text search"""
 
-    def __init__(self, k1=1.5, b=0.75):
+    def __init__(self, k1=1.5, b=0.75, tokenizer=None):
         self.k1 = k1
         self.b = b
-        self.corpus = []
+        self.tokenizer = tokenizer or Tokenizer()
         self.doc_lengths = []
         self.avgdl = 0
         self.idf = {}
         self.doc_freqs = defaultdict(int)
+        self.postings = {}
+        self.norms = []
         self.N = 0
 
     def tokenize(self, text):
         """Lowercase, split, remove punctuation, filter short words"""
-        text = re.sub(r'[^\w\s]', ' ', str(text).lower())
-        return [w for w in text.split() if len(w) > 2]
+        return self.tokenizer.tokenize(text)
 
     def fit(self, documents):
-        """Build BM25 index from documents"""
-        self.corpus = [self.tokenize(doc) for doc in documents]
-        self.N = len(self.corpus)
+        """Build inverted index (term -> [(doc id, tf)]) from documents"""
+        corpus = [self.tokenize(doc) for doc in documents]
+        self.N = len(corpus)
         if self.N == 0:
             return
-        self.doc_lengths = [len(doc) for doc in self.corpus]
+        self.doc_lengths = [len(doc) for doc in corpus]
         self.avgdl = sum(self.doc_lengths) / self.N
 
-        for doc in self.corpus:
-            seen = set()
-            for word in doc:
-                if word not in seen:
-                    self.doc_freqs[word] += 1
-                    seen.add(word)
+        # Length normalisation part of the BM25 denominator, per document
+        self.norms = [self.k1 * (1 - self.b + self.b * doc_len / self.avgdl) for doc_len in self.doc_lengths]
 
-        for word, freq in self.doc_freqs.items():
-            self.idf[word] = log((self.N - freq + 0.5) / (freq + 0.5) + 1)
+        postings = defaultdict(list)
+        for idx, doc in enumerate(corpus):
+            term_freqs = defaultdict(int)
+            for word in doc:
+                term_freqs[word] += 1
+            for word, tf in term_freqs.items():
+                postings[word].append((idx, tf))
+        self._set_postings(postings)
+
+    def _set_postings(self, postings):
+        """Store the inverted index and derive document frequencies and IDF"""
+        self.postings = dict(postings)
+        for word, entries in self.postings.items():
+            self.doc_freqs[word] = len(entries)
+            self.idf[word] = log((self.N - len(entries) + 0.5) / (len(entries) + 0.5) + 1)
+
+    def _accumulate(self, query):
+        """Sum BM25 contributions for documents sharing a term with the query"""
+        scores = {}
+        for token in self.tokenizer.tokenize_query(query):
+            entries = self.postings.get(token)
+            if not entries:
+                continue
+            idf = self.idf[token]
+            for idx, tf in entries:
+                numerator = tf * (self.k1 + 1)
+                denominator = tf + self.norms[idx]
+                scores[idx] = scores.get(idx, 0) + idf * numerator / denominator
+        return scores
 
     def score(self, query):
         """Score all documents against query"""
-        query_tokens = self.tokenize(query)
-        scores = []
+        matched = self._accumulate(query)
+        scores = [(idx, matched.get(idx, 0)) for idx in range(self.N)]
+        return sorted(scores, key=lambda x: x[1], reverse=True)
 
-        for idx, doc in enumerate(self.corpus):
-            score = 0
-            doc_len = self.doc_lengths[idx]
-            term_freqs = defaultdict(int)
-            for word in doc:
-                term_freqs[word] += 1
+    def score_topk(self, query, k):
+        """Return the k best (doc id, score) pairs with score > 0, ties in row order"""
+        if k <= 0:
+            return []
+        matched = [(idx, score) for idx, score in self._accumulate(query).items() if score > 0]
+        return heapq.nsmallest(k, matched, key=lambda x: (-x[1], x[0]))
 
-            for token in query_tokens:
-                if token in self.idf:
-                    tf = term_freqs[token]
-                    idf = self.idf[token]
-                    numerator = tf * (self.k1 + 1)
-                    denominator = tf + self.k1 * (1 - self.b + self.b * doc_len / self.avgdl)
-                    score += idf * numerator / denominator
+    def score_batch(self, queries, k):
+        """score_topk for several queries against the same index"""
+        return [self.score_topk(query, k) for query in queries]
 
-            scores.append((idx, score))
 
-        return sorted(scores, key=lambda x: x[1], reverse=True)
+class BM25F(BM25):
+    """BM25F: BM25 over several fields, each with its own weight and length normalisation
 
+    Per-field term frequencies are folded into one pseudo frequency at fit time,
+    tf~ = sum(w_f * tf_f / (1 - b_f + b_f * len_f / avglen_f)), and stored in the
+    postings with a constant norm of k1. Scoring is then exactly BM25's, so a
+    weighted query costs no more than an unweighted one (on either engine).
+    """
 
-# ============ SEARCH FUNCTIONS ============
-def _load_csv(filepath):
-    """Load CSV and return list of dicts"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return list(csv.DictReader(f))
+    def __init__(self, fields, k1=1.5, b=0.75, tokenizer=None):
+        super().__init__(k1, b, tokenizer)
+        self.fields = [(weight, self.b if b is None else b) for weight, b in fields]
+        self.field_avgdl = []
+
+    def fit(self, documents):
+        """Build the inverted index from documents given as one text per field"""
+        corpus = [[self.tokenize(text) for text in fields] for fields in documents]
+        self.N = len(corpus)
+        if self.N == 0:
+            return
+        self.doc_lengths = [sum(len(field) for field in doc) for doc in corpus]
+        self.avgdl = sum(self.doc_lengths) / self.N
+        self.field_avgdl = [sum(len(doc[pos]) for doc in corpus) / self.N for pos in range(len(self.fields))]
+        self.norms = [self.k1] * self.N
+
+        postings = defaultdict(list)
+        for idx, doc in enumerate(corpus):
+            term_freqs = defaultdict(float)
+            for (weight, b), avgdl, field in zip(self.fields, self.field_avgdl, doc):
+                if not field:
+                    continue
+                field_weight = weight / (1 - b + b * len(field) / avgdl)
+                for word in field:
+                    term_freqs[word] += field_weight
+            for word, tf in term_freqs.items():
+                postings[word].append((idx, tf))
+        self._set_postings(postings)
+
+
+# ============ SPARSE (NUMPY) ENGINE ============
+_numpy = None
+
+
+def _load_numpy():
+    """Import NumPy on first use; None when it is not installed"""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy or None
+
+
+class SparseBM25:
+    """BM25 over a CSR term-document matrix of precomputed weights (requires NumPy)
+
+    Rows are terms, columns documents, values the full BM25 contribution of a
+    term to a document. A query is a sparse matrix-vector product; contributions
+    are summed in query-token order so scores match BM25 bit for bit.
+    """
+
+    def __init__(self, bm25):
+        np = _load_numpy()
+        if np is None:
+            raise ImportError("SparseBM25 requires NumPy")
+        self.bm25 = bm25
+        self.N = bm25.N
+        self.vocab = {}
+
+        indptr, indices, data = [0], [], []
+        for term, entries in bm25.postings.items():
+            idf = bm25.idf[term]
+            self.vocab[term] = len(self.vocab)
+            for idx, tf in entries:
+                numerator = tf * (bm25.k1 + 1)
+                denominator = tf + bm25.norms[idx]
+                indices.append(idx)
+                data.append(idf * numerator / denominator)
+            indptr.append(len(indices))
+
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.data = np.asarray(data, dtype=np.float64)
+
+    def tokenize(self, text):
+        return self.bm25.tokenize(text)
+
+    def _query_columns(self, query):
+        """Matrix slices hit by a query (repeated tokens count again, like BM25)"""
+        np = _numpy
+        rows = [self.vocab[token] for token in self.bm25.tokenizer.tokenize_query(query) if token in self.vocab]
+        if not rows:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+        spans = [slice(self.indptr[row], self.indptr[row + 1]) for row in rows]
+        return (np.concatenate([self.indices[span] for span in spans]),
+                np.concatenate([self.data[span] for span in spans]))
+
+    def scores(self, query):
+        """Dense vector of document scores for one query"""
+        indices, weights = self._query_columns(query)
+        return _numpy.bincount(indices, weights=weights, minlength=self.N)
+
+    def score(self, query):
+        """Score all documents against query"""
+        scores = self.scores(query)
+        order = _numpy.argsort(-scores, kind="stable")
+        return [(int(idx), float(scores[idx])) for idx in order]
+
+    def _topk(self, scores, k):
+        np = _numpy
+        candidates = np.flatnonzero(scores > 0)
+        order = np.lexsort((candidates, -scores[candidates]))[:max(k, 0)]
+        return [(int(candidates[i]), float(scores[candidates[i]])) for i in order]
+
+    def score_topk(self, query, k):
+        """Return the k best (doc id, score) pairs with score > 0, ties in row order"""
+        return self._topk(self.scores(query), k)
+
+    def score_batch(self, queries, k):
+        """Score several queries with one bincount over (query, document) cells"""
+        np = _numpy
+        if not queries or self.N == 0:
+            return [[] for _ in queries]
+        indices, weights = [], []
+        for offset, query in enumerate(queries):
+            query_indices, query_weights = self._query_columns(query)
+            indices.append(query_indices + offset * self.N)
+            weights.append(query_weights)
+        scores = np.bincount(np.concatenate(indices), weights=np.concatenate(weights),
+                             minlength=len(queries) * self.N).reshape(len(queries), self.N)
+        return [self._topk(row, k) for row in scores]
+
+
+
+# ============ INDEX STORAGE ============
+def _file_fingerprint(filepath):
+    """Cheap change marker for a CSV: (size, mtime in ns)"""
+    stat = filepath.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _file_hash(filepath):
+    """Content hash used when the fingerprint changed but the bytes may not have"""
+    import hashlib  # only needed when (re)building or revalidating an index
+
+    with open(filepath, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def data_fingerprint():
+    """Hash of (path, size, mtime) for every CSV under DATA_DIR; changes when any dataset does"""
+    import hashlib
+
+    digest = hashlib.sha1()
+    for filepath in sorted(DATA_DIR.rglob("*.csv")):
+        size, mtime_ns = _file_fingerprint(filepath)
+        digest.update(f"{filepath.relative_to(DATA_DIR).as_posix()}|{size}|{mtime_ns}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _field_params(search_cols, field_weights):
+    """(weight, b) per search column for BM25F, or None for plain BM25; b=None uses the model's b"""
+    if not field_weights:
+        return None
+    params = []
+    for col in search_cols:
+        weight = field_weights.get(col, 1.0)
+        params.append(tuple(weight) if isinstance(weight, (tuple, list)) else (weight, None))
+    return params
+
+
+def _index_path(filepath, search_cols, field_weights=None):
+    """Location of the compiled index for a CSV, its search columns and field weights"""
+    # crc32 keeps the per-query path cheap; load_index checks source/search_cols on collision
+    source = f"{Path(filepath).resolve()}|{'|'.join(search_cols)}|{_field_params(search_cols, field_weights)}"
+    key = f"{zlib.crc32(source.encode('utf-8')):08x}"
+    return INDEX_DIR / f"{Path(filepath).stem}-{key}.idx"
+
+
+def _write_index(path, payload):
+    """Atomically write an index payload; silently skip unwritable cache dirs"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def build_index(filepath, search_cols, field_weights=None):
+    """Parse a CSV, fit BM25 (or BM25F) over its search columns and store the compiled index"""
+    filepath = Path(filepath)
+    # Fingerprint before reading so a concurrent edit leaves the index stale, not wrong
+    size, mtime_ns = _file_fingerprint(filepath)
+    data = RowStore.from_csv(filepath)
+
+    fields = _field_params(search_cols, field_weights)
+    tokenizer = Tokenizer(**TOKENIZER_OPTIONS)
+    if fields:
+        # One text per search column, so each keeps its own length statistics
+        documents = [[data.value(idx, col) for col in search_cols] for idx in range(len(data))]
+        bm25 = BM25F(fields, tokenizer=tokenizer)
+    else:
+        # Build documents from search columns
+        documents = [data.document(idx, search_cols) for idx in range(len(data))]
+        bm25 = BM25(tokenizer=tokenizer)
+    bm25.fit(documents)
+
+    payload = {
+        "version": INDEX_VERSION,
+        "source": str(filepath),
+        "search_cols": list(search_cols),
+        "fields": fields,
+        "size": size,
+        "mtime_ns": mtime_ns,
+        "sha1": _file_hash(filepath),
+        "tokenizer": bm25.tokenizer.config(),
+        "rows": data,
+        "bm25": bm25,
+    }
+    _write_index(_index_path(filepath, search_cols, field_weights), payload)
+    return payload
+
+
+def load_index(filepath, search_cols, field_weights=None):
+    """Load the compiled index for a CSV, rebuilding it when the CSV or its config changed"""
+    filepath = Path(filepath)
+    path = _index_path(filepath, search_cols, field_weights)
+    try:
+        with open(path, 'rb') as f:
+            payload = pickle.load(f)
+    except Exception:
+        # Missing, corrupt or written by an incompatible version: rebuild
+        return build_index(filepath, search_cols, field_weights)
+
+    if (payload.get("version") != INDEX_VERSION or payload.get("source") != str(filepath)
+            or payload.get("search_cols") != list(search_cols) or payload.get("fields") != _field_params(search_cols, field_weights)
+            or payload.get("tokenizer") != Tokenizer(**TOKENIZER_OPTIONS).config()):
+        return build_index(filepath, search_cols, field_weights)
+
+    size, mtime_ns = _file_fingerprint(filepath)
+    if (payload["size"], payload["mtime_ns"]) == (size, mtime_ns):
+        return payload
+
+    # Touched but possibly unchanged (checkout, copy): compare content before refitting
+    if payload["sha1"] != _file_hash(filepath):
+        return build_index(filepath, search_cols, field_weights)
+    payload["size"], payload["mtime_ns"] = size, mtime_ns
+    _write_index(path, payload)
+    return payload
+
+
+def _dataset_targets():
+    """(csv path, search columns, field weights) for every configured domain and stack"""
+    targets = [(DATA_DIR / config["file"], config["search_cols"], config.get("field_weights")) for config in CSV_CONFIG.values()]
+    targets += [(DATA_DIR / config["file"], _STACK_COLS["search_cols"], _STACK_COLS.get("field_weights")) for config in STACK_CONFIG.values()]
+    return [target for target in targets if target[0].exists()]
+
+
+def build_all_indexes():
+    """Compile indexes for every domain and stack dataset; returns built file paths"""
+    built = []
+    for filepath, search_cols, field_weights in _dataset_targets():
+        build_index(filepath, search_cols, field_weights)
+        built.append(str(_index_path(filepath, search_cols, field_weights)))
+    return built
+
+
+# ============ IN-PROCESS INDEX CACHE ============
+_index_cache = OrderedDict()  # (file, search_cols, fields) -> (fingerprint, index, CSV size)
+_index_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+_index_cache_lock = threading.Lock()
+
+
+def _evict_indexes():
+    """Drop least recently used indexes until the cache fits its entry and source-size budget"""
+    total = sum(entry[2] for entry in _index_cache.values())
+    while _index_cache and (len(_index_cache) > INDEX_CACHE_MAX_ENTRIES or total > INDEX_CACHE_MAX_SOURCE_BYTES):
+        _, (_, _, size) = _index_cache.popitem(last=False)
+        total -= size
+        _index_cache_stats["evictions"] += 1
+
+
+def get_index(filepath, search_cols, field_weights=None):
+    """Return the fitted index for a CSV, reusing it across calls in this process"""
+    filepath = Path(filepath)
+    fields = _field_params(search_cols, field_weights)
+    key = (str(filepath), tuple(search_cols), tuple(fields) if fields else None)
+    fingerprint = _file_fingerprint(filepath)
+
+    with _index_cache_lock:
+        entry = _index_cache.get(key)
+        if entry is not None and entry[0] == fingerprint:
+            _index_cache.move_to_end(key)
+            _index_cache_stats["hits"] += 1
+            return entry[1]
+        _index_cache_stats["misses"] += 1
+
+    index = load_index(filepath, search_cols, field_weights)
+
+    with _index_cache_lock:
+        _index_cache[key] = (fingerprint, index, fingerprint[0])
+        _index_cache.move_to_end(key)
+        _evict_indexes()
+    return index
+
+
+def preload_indexes():
+    """Load every dataset into the in-process cache (used by long-lived processes)"""
+    for filepath, search_cols, field_weights in _dataset_targets():
+        get_index(filepath, search_cols, field_weights)
+
+
+def set_search_engine(name):
+    """Select the scoring engine ("python" or "numpy") for this process"""
+    global SEARCH_ENGINE
+    if name not in SEARCH_ENGINES:
+        raise ValueError(f"Unknown search engine: {name}. Available: {', '.join(SEARCH_ENGINES)}")
+    SEARCH_ENGINE = name
+
+
+def get_scorer(index):
+    """BM25 scorer for a loaded index according to SEARCH_ENGINE"""
+    if SEARCH_ENGINE == "numpy" and _load_numpy() is not None:
+        sparse = index.get("sparse")
+        if sparse is None:
+            # Derived per process, never pickled, so stored indexes stay NumPy-free
+            sparse = index["sparse"] = SparseBM25(index["bm25"])
+        return sparse
+    return index["bm25"]
+
+
+def configure_index_cache(max_entries=None, max_source_bytes=None):
+    """Adjust the in-process cache budget (entries, summed CSV sizes); evicts immediately if it shrank"""
+    global INDEX_CACHE_MAX_ENTRIES, INDEX_CACHE_MAX_SOURCE_BYTES
+    with _index_cache_lock:
+        if max_entries is not None:
+            INDEX_CACHE_MAX_ENTRIES = max_entries
+        if max_source_bytes is not None:
+            INDEX_CACHE_MAX_SOURCE_BYTES = max_source_bytes
+        _evict_indexes()
+
+
+def index_cache_info():
+    """Hit/miss/eviction counters and current size of the in-process cache"""
+    with _index_cache_lock:
+        return {
+            **_index_cache_stats,
+            "entries": len(_index_cache),
+            "source_bytes": sum(entry[2] for entry in _index_cache.values()),
+            "max_entries": INDEX_CACHE_MAX_ENTRIES,
+            "max_source_bytes": INDEX_CACHE_MAX_SOURCE_BYTES,
+        }
+
+
+def index_cache_clear():
+    """Empty the in-process cache and reset its counters"""
+    with _index_cache_lock:
+        _index_cache.clear()
+        for name in _index_cache_stats:
+            _index_cache_stats[name] = 0
+
+
+# ============ KEYWORD MATCHING ============
+class KeywordMatcher:
+    """Aho-Corasick automaton: every keyword occurring in a text, found in one pass
+
+    Overlapping and nested occurrences are all reported, so the result equals
+    {kw for kw in keywords if kw in text} at a cost independent of the keyword count.
+    """
+
+    def __init__(self, keywords):
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [()]
+        for keyword in keywords:
+            state = 0
+            for char in keyword:
+                nxt = self.goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][char] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append(())
+                state = nxt
+            if keyword not in self.out[state]:
+                self.out[state] += (keyword,)
+
+        # Breadth-first, so a state's failure target is complete before it is used
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self.goto[state].items():
+                queue.append(nxt)
+                fail = self.fail[state]
+                while fail and char not in self.goto[fail]:
+                    fail = self.fail[fail]
+                self.fail[nxt] = self.goto[fail].get(char, 0)
+                self.out[nxt] += self.out[self.fail[nxt]]
+
+    def find(self, text):
+        """Set of keywords that occur in text"""
+        goto, fail, out = self.goto, self.fail, self.out
+        found = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+
+_keyword_matcher = None
+_keyword_domains = {}  # keyword -> domains listing it (repeated if listed twice)
+
+
+def _domain_matcher():
+    """KeywordMatcher over DOMAIN_KEYWORDS, compiled on first use"""
+    global _keyword_matcher
+    if _keyword_matcher is None:
+        _keyword_domains.clear()
+        for domain, keywords in DOMAIN_KEYWORDS.items():
+            for keyword in keywords:
+                _keyword_domains.setdefault(keyword, []).append(domain)
+        _keyword_matcher = KeywordMatcher(_keyword_domains)
+    return _keyword_matcher
 
 
-def _search_csv(filepath, search_cols, output_cols, query, max_results):
-    """Core search function using BM25"""
+# ============ SEARCH FUNCTIONS ============
+def _search_csv(filepath, search_cols, output_cols, query, max_results, field_weights=None):
+    """Core search function using BM25 (BM25F when field weights are configured)"""
     if not filepath.exists():
         return []
 
-    data = _load_csv(filepath)
+    index = get_index(filepath, search_cols, field_weights)
 
-    # Build documents from search columns
-    documents = [" ".join(str(row.get(col, "")) for col in search_cols) for row in data]
+    # BM25 search: top results with score > 0
+    ranked = get_scorer(index).score_topk(query, max_results)
+    return _materialize(index, ranked, output_cols)
 
-    # BM25 search
-    bm25 = BM25()
-    bm25.fit(documents)
-    ranked = bm25.score(query)
 
-    # Get top results with score > 0
-    results = []
-    for idx, score in ranked[:max_results]:
-        if score > 0:
-            row = data[idx]
-            results.append({col: row.get(col, "") for col in output_cols if col in row})
-
-    return results
-
-
-def detect_domain(query):
-    """Auto-detect the most relevant domain from query"""
-    query_lower = query.lower()
-
-    domain_keywords = {
-        "color": ["color", "palette", "hex", "#", "rgb"],
-        "chart": ["chart", "graph", "visualization", "trend", "bar", "pie", "scatter", "heatmap", "funnel"],
-        "landing": ["landing", "page", "cta", "conversion", "hero", "testimonial", "pricing", "section"],
-        "product": ["saas", "ecommerce", "e-commerce", "fintech", "healthcare", "gaming", "portfolio", "crypto", "dashboard"],
-        "style": ["style", "design", "ui", "minimalism", "glassmorphism", "neumorphism", "brutalism", "dark mode", "flat", "aurora", "prompt", "css", "implementation", "variable", "checklist", "tailwind"],
-        "ux": ["ux", "usability", "accessibility", "wcag", "touch", "scroll", "animation", "keyboard", "navigation", "mobile"],
-        "typography": ["font", "typography", "heading", "serif", "sans"],
-        "icons": ["icon", "icons", "lucide", "heroicons", "symbol", "glyph", "pictogram", "svg icon"],
-        "react": ["react", "next.js", "nextjs", "suspense", "memo", "usecallback", "useeffect", "rerender", "bundle", "waterfall", "barrel", "dynamic import", "rsc", "server component"],
-        "web": ["aria", "focus", "outline", "semantic", "virtualize", "autocomplete", "form", "input type", "preconnect"]
-    }
+def _materialize(index, ranked, output_cols):
+    """Turn ranked (doc id, score) pairs into output rows"""
+    data = index["rows"]
+    return [data.materialize(idx, output_cols) for idx, score in ranked]
+
+
+def detect_domain(query, fallback=False):
+    """Auto-detect the most relevant domain from query
+
+    Domains are scored by how many of their keywords occur in the query (one
+    automaton pass); ties go to the earlier domain. Without any keyword hit the
+    answer is "style", or with fallback=True the domain whose index ranks the
+    query highest (normalised as in search_all).
+    """
+    scores = defaultdict(int)
+    for keyword in _domain_matcher().find(query.lower()):
+        for domain in _keyword_domains[keyword]:
+            scores[domain] += 1
+    if scores:
+        return max(DOMAIN_KEYWORDS, key=lambda domain: scores[domain])
+    return _vocabulary_domain(query) if fallback else "style"
 
-    scores = {domain: sum(1 for kw in keywords if kw in query_lower) for domain, keywords in domain_keywords.items()}
-    best = max(scores, key=scores.get)
-    return best if scores[best] > 0 else "style"
 
+def _vocabulary_domain(query):
+    """Domain whose best BM25 hit for query has the highest normalised relevance ("style" if none)"""
+    best, best_relevance = "style", 0
+    for domain, config in CSV_CONFIG.items():
+        filepath = DATA_DIR / config["file"]
+        if not filepath.exists():
+            continue
+        top = _normalized_topk(get_index(filepath, config["search_cols"], config.get("field_weights")), query, 1)
+        if top and top[0][0] > best_relevance:
+            best, best_relevance = domain, top[0][0]
+    return best
 
-def search(query, domain=None, max_results=MAX_RESULTS):
+
+def search(query, domain=None, max_results=MAX_RESULTS, detect_fallback=False):
     """Main search function with auto-domain detection"""
     if domain is None:
-        domain = detect_domain(query)
+        domain = detect_domain(query, detect_fallback)
 
     config = CSV_CONFIG.get(domain, CSV_CONFIG["style"])
     filepath = DATA_DIR / config["file"]
@@ -220,7 +806,8 @@ def search(query, domain=None, max_results=MAX_RESULTS):
     if not filepath.exists():
         return {"error": f"File not found: {filepath}", "domain": domain}
 
-    results = _search_csv(filepath, config["search_cols"], config["output_cols"], query, max_results)
+    results = _search_csv(filepath, config["search_cols"], config["output_cols"], query, max_results,
+                          config.get("field_weights"))
 
     return {
         "domain": domain,
@@ -231,6 +818,46 @@ def search(query, domain=None, max_results=MAX_RESULTS):
     }
 
 
+def search_batch(requests):
+    """Run many (domain, query, max_results) searches in one pass
+
+    Requests are grouped by domain so each index is fetched once and its
+    queries are scored together. Returns one search() payload per request,
+    in request order; a domain of None is auto-detected per query.
+    """
+    responses = [None] * len(requests)
+    groups = defaultdict(list)
+    for pos, (domain, query, max_results) in enumerate(requests):
+        if domain is None:
+            domain = detect_domain(query)
+        groups[domain].append((pos, query, max_results))
+
+    for domain, items in groups.items():
+        config = CSV_CONFIG.get(domain, CSV_CONFIG["style"])
+        filepath = DATA_DIR / config["file"]
+        if not filepath.exists():
+            for pos, _, _ in items:
+                responses[pos] = {"error": f"File not found: {filepath}", "domain": domain}
+            continue
+
+        index = get_index(filepath, config["search_cols"], config.get("field_weights"))
+        # Top-k lists are prefixes of each other, so score once with the largest k
+        k = max(max_results for _, _, max_results in items)
+        ranked = get_scorer(index).score_batch([query for _, query, _ in items], k)
+
+        for (pos, query, max_results), top in zip(items, ranked):
+            results = _materialize(index, top[:max(max_results, 0)], config["output_cols"])
+            responses[pos] = {
+                "domain": domain,
+                "query": query,
+                "file": config["file"],
+                "count": len(results),
+                "results": results
+            }
+
+    return responses
+
+
 def search_stack(query, stack, max_results=MAX_RESULTS):
     """Search stack-specific guidelines"""
     if stack not in STACK_CONFIG:
@@ -241,7 +868,8 @@ def search_stack(query, stack, max_results=MAX_RESULTS):
     if not filepath.exists():
         return {"error": f"Stack file not found: {filepath}", "stack": stack}
 
-    results = _search_csv(filepath, _STACK_COLS["search_cols"], _STACK_COLS["output_cols"], query, max_results)
+    results = _search_csv(filepath, _STACK_COLS["search_cols"], _STACK_COLS["output_cols"], query, max_results,
+                          _STACK_COLS.get("field_weights"))
 
     return {
         "domain": "stack",
@@ -251,3 +879,68 @@ def search_stack(query, stack, max_results=MAX_RESULTS):
         "count": len(results),
         "results": results
     }
+
+
+def _query_bound(bm25, query):
+    """Best score any document of this corpus could reach for query, and the share of query terms it knows
+
+    A term contributes at most idf * (k1 + 1) (its limit as tf grows), so the
+    sum over known query terms bounds every document's BM25/BM25F score.
+    """
+    tokens = bm25.tokenizer.tokenize_query(query)
+    if not tokens:
+        return 0, 0
+    known = [token for token in tokens if token in bm25.idf]
+    bound = sum(bm25.idf[token] for token in known) * (bm25.k1 + 1)
+    return bound, len(set(known)) / len(set(tokens))
+
+
+def _normalized_topk(index, query, k):
+    """Top-k (relevance, doc id) of one index, with scores comparable across corpora"""
+    bound, coverage = _query_bound(index["bm25"], query)
+    if not bound:
+        return []
+    # Normalisation is monotonic per corpus, so the corpus' own top-k suffices
+    return [(score / bound * coverage, idx) for idx, score in get_scorer(index).score_topk(query, k)]
+
+
+def _federated_targets(include_stacks):
+    """(source label, file, search cols, output cols, field weights) searched by search_all"""
+    targets = [(domain, config["file"], config["search_cols"], config["output_cols"], config.get("field_weights"))
+               for domain, config in CSV_CONFIG.items()]
+    if include_stacks:
+        targets += [(f"stack:{stack}", config["file"], _STACK_COLS["search_cols"], _STACK_COLS["output_cols"],
+                     _STACK_COLS.get("field_weights")) for stack, config in STACK_CONFIG.items()]
+    return targets
+
+
+def search_all(query, max_results=MAX_RESULTS, include_stacks=False):
+    """Federated search: query every domain (and optionally every stack) and merge into one ranking
+
+    Raw BM25 scores are not comparable across corpora, so each is divided by the
+    best score the query could reach in its corpus and scaled by the share of
+    query terms that corpus knows. Every hit carries its "Source Domain" and
+    normalised "Relevance" (0-1); ties keep domain order, then row order.
+    """
+    hits, files = [], []
+    for order, (source, file, search_cols, output_cols, field_weights) in enumerate(_federated_targets(include_stacks)):
+        filepath = DATA_DIR / file
+        if not filepath.exists():
+            continue
+        files.append(file)
+        index = get_index(filepath, search_cols, field_weights)
+        for relevance, idx in _normalized_topk(index, query, max_results):
+            hits.append((-relevance, order, idx, source, index, output_cols))
+
+    results = []
+    for neg_relevance, _, idx, source, index, output_cols in heapq.nsmallest(max(max_results, 0), hits, key=lambda hit: hit[:3]):
+        row = index["rows"].materialize(idx, output_cols)
+        results.append({"Source Domain": source, **row, "Relevance": round(-neg_relevance, 3)})
+
+    return {
+        "domain": "all",
+        "query": query,
+        "files": files,
+        "count": len(results),
+        "results": results
+    }
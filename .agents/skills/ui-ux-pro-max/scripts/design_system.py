@@ -13,17 +13,33 @@ Usage:
     result = generate_design_system("SaaS dashboard", "My Project", persist=True, page="dashboard")
 """
 
+import copy
 import csv
+import hashlib
 import json
 import os
+import re
+import shutil
+import time
+import zlib
+from bisect import bisect_right
+from collections import OrderedDict
 from datetime import datetime
+from itertools import accumulate
 from pathlib import Path
-from core import search, DATA_DIR
+import core
+from core import search, search_batch, data_fingerprint, preload_indexes, CACHE_DIR, DATA_DIR
 
 
 # ============ CONFIGURATION ============
 REASONING_FILE = "ui-reasoning.csv"
 
+# Memoized generate(): in-process entries plus JSON files shared across processes
+DESIGN_CACHE_DIR = CACHE_DIR / "design-system"
+DESIGN_CACHE_VERSION = 2  # bump when ranking or generator output changes
+DESIGN_CACHE_MAX_ENTRIES = 256
+DESIGN_CACHE_STALE_DAYS = 30  # other installs' cache directories unused this long are removed
+
 SEARCH_CONFIG = {
     "product": {"max_results": 1},
     "style": {"max_results": 3},
@@ -39,6 +55,7 @@ class DesignSystemGenerator:
 
     def __init__(self):
         self.reasoning_data = self._load_reasoning()
+        self._index_reasoning()
 
     def _load_reasoning(self) -> list:
         """Load reasoning rules from CSV."""
@@ -48,46 +65,95 @@ class DesignSystemGenerator:
         with open(filepath, 'r', encoding='utf-8') as f:
             return list(csv.DictReader(f))
 
-    def _multi_domain_search(self, query: str, style_priority: list = None) -> dict:
-        """Execute searches across multiple domains."""
-        results = {}
+    def _index_reasoning(self) -> None:
+        """Build rule lookup structures and parse Decision_Rules once."""
+        self._rule_categories = [rule.get("UI_Category", "").lower() for rule in self.reasoning_data]
+        self._exact_rules = {}
+        self._keyword_rules = {}
+        self._decision_rules = []
+        self._rule_lookup_cache = {}
+
+        for idx, (rule, ui_cat) in enumerate(zip(self.reasoning_data, self._rule_categories)):
+            # First rule wins in every tier, so only record the first occurrence
+            self._exact_rules.setdefault(ui_cat, idx)
+            for kw in ui_cat.replace("/", " ").replace("-", " ").split():
+                self._keyword_rules.setdefault(kw, idx)
+
+            decision_rules = {}
+            try:
+                decision_rules = json.loads(rule.get("Decision_Rules", "{}"))
+            except json.JSONDecodeError:
+                pass
+            self._decision_rules.append(decision_rules)
+
+        # Partial tier: rule categories joined in rule order, so one find() locates the first
+        # rule containing a category, and the distinct category lengths for the reverse direction
+        self._category_text = "\0".join(self._rule_categories)
+        self._category_offsets = list(accumulate((len(ui_cat) + 1 for ui_cat in self._rule_categories[:-1]), initial=0))
+        self._category_lengths = sorted({len(ui_cat) for ui_cat in self._exact_rules})
+        self._keyword_lengths = sorted({len(kw) for kw in self._keyword_rules})
+
+    def _multi_domain_search(self, query: str, style_priority: list = None, exclude: tuple = ()) -> dict:
+        """Execute searches across multiple domains in a single batch."""
+        requests = []
         for domain, config in SEARCH_CONFIG.items():
+            if domain in exclude:
+                continue
             if domain == "style" and style_priority:
                 # For style, also search with priority keywords
                 priority_query = " ".join(style_priority[:2]) if style_priority else query
                 combined_query = f"{query} {priority_query}"
-                results[domain] = search(combined_query, domain, config["max_results"])
+                requests.append((domain, combined_query, config["max_results"]))
             else:
-                results[domain] = search(query, domain, config["max_results"])
-        return results
-
-    def _find_reasoning_rule(self, category: str) -> dict:
-        """Find matching reasoning rule for a category."""
-        category_lower = category.lower()
+                requests.append((domain, query, config["max_results"]))
+        return {domain: result for (domain, _, _), result in zip(requests, search_batch(requests))}
 
+    def _match_reasoning_index(self, category_lower: str) -> int:
+        """Index of the first matching rule for a lowercased category, or -1."""
         # Try exact match first
-        for rule in self.reasoning_data:
-            if rule.get("UI_Category", "").lower() == category_lower:
-                return rule
-
-        # Try partial match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            if ui_cat in category_lower or category_lower in ui_cat:
-                return rule
+        idx = self._exact_rules.get(category_lower)
+        if idx is not None:
+            return idx
+
+        # Try partial match: the category inside a rule category, or a rule category inside it
+        matches = [
+            self._exact_rules[category_lower[start:start + length]]
+            for length in self._category_lengths
+            for start in range(len(category_lower) - length + 1)
+            if category_lower[start:start + length] in self._exact_rules
+        ]
+        position = self._category_text.find(category_lower) if "\0" not in category_lower else -1
+        if position >= 0 and self._rule_categories:
+            matches.append(bisect_right(self._category_offsets, position) - 1)
+        if matches:
+            return min(matches)
+
+        # Try keyword match: any rule keyword occurring inside the category
+        matches = [
+            self._keyword_rules[category_lower[start:start + length]]
+            for length in self._keyword_lengths
+            for start in range(len(category_lower) - length + 1)
+            if category_lower[start:start + length] in self._keyword_rules
+        ]
+        return min(matches) if matches else -1
 
-        # Try keyword match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            keywords = ui_cat.replace("/", " ").replace("-", " ").split()
-            if any(kw in category_lower for kw in keywords):
-                return rule
+    def _find_reasoning_index(self, category: str) -> int:
+        """Cached rule index for a category, or -1 when nothing matches."""
+        category_lower = category.lower()
+        idx = self._rule_lookup_cache.get(category_lower)
+        if idx is None:
+            idx = self._rule_lookup_cache[category_lower] = self._match_reasoning_index(category_lower)
+        return idx
 
-        return {}
+    def _find_reasoning_rule(self, category: str) -> dict:
+        """Find matching reasoning rule for a category."""
+        idx = self._find_reasoning_index(category)
+        return self.reasoning_data[idx] if idx >= 0 else {}
 
     def _apply_reasoning(self, category: str, search_results: dict) -> dict:
         """Apply reasoning rules to search results."""
-        rule = self._find_reasoning_rule(category)
+        idx = self._find_reasoning_index(category)
+        rule = self.reasoning_data[idx] if idx >= 0 else {}
 
         if not rule:
             return {
@@ -101,12 +167,8 @@ class DesignSystemGenerator:
                 "severity": "MEDIUM"
             }
 
-        # Parse decision rules JSON
-        decision_rules = {}
-        try:
-            decision_rules = json.loads(rule.get("Decision_Rules", "{}"))
-        except json.JSONDecodeError:
-            pass
+        # Decision rules JSON was parsed once at init
+        decision_rules = self._decision_rules[idx]
 
         return {
             "pattern": rule.get("Recommended_Pattern", ""),
@@ -174,7 +236,7 @@ class DesignSystemGenerator:
         style_priority = reasoning.get("style_priority", [])
 
         # Step 3: Multi-domain search with style priority hints
-        search_results = self._multi_domain_search(query, style_priority)
+        search_results = self._multi_domain_search(query, style_priority, exclude=("product",))
         search_results["product"] = product_result  # Reuse product search
 
         # Step 4: Select best matches from each domain using priority
@@ -236,6 +298,155 @@ class DesignSystemGenerator:
         }
 
 
+# ============ MEMOIZED GENERATION ============
+_design_cache = OrderedDict()  # cache key -> design system dict
+_shared_generator = None  # (data fingerprint, DesignSystemGenerator)
+_source_digest = None  # sha1 of core.py + design_system.py, read once per process
+_pruned_generation = None  # cache generation whose stale siblings were already removed
+
+
+def _normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a query (search tokenizes the same way)."""
+    return " ".join(query.lower().split())
+
+
+def code_fingerprint() -> str:
+    """Hash of the search/generator code and the ranking config; changes with any ranking change."""
+    global _source_digest
+    if _source_digest is None:
+        digest = hashlib.sha1()
+        for module_file in (core.__file__, __file__):
+            with open(module_file, 'rb') as f:
+                digest.update(f.read())
+        _source_digest = digest.hexdigest()
+    # Config is hashed on every call: callers may reconfigure core at runtime
+    config = [core.INDEX_VERSION, core.TOKENIZER_OPTIONS, core.CSV_CONFIG, core._STACK_COLS, SEARCH_CONFIG]
+    return hashlib.sha1(json.dumps([_source_digest, config], sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def _cache_generation(fingerprint: str) -> str:
+    """Everything generate() output depends on besides its arguments: cache format, data files, code and config."""
+    raw = json.dumps([DESIGN_CACHE_VERSION, fingerprint, code_fingerprint()])
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+
+def _design_cache_key(query: str, project_name: str, fingerprint: str) -> str:
+    """Key over everything generate() output depends on."""
+    display_name = project_name or query.upper()
+    raw = json.dumps([_cache_generation(fingerprint), _normalize_query(query), display_name])
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def _get_generator(fingerprint: str) -> DesignSystemGenerator:
+    """Generator reused while the data files are unchanged."""
+    global _shared_generator
+    if _shared_generator is None or _shared_generator[0] != fingerprint:
+        _shared_generator = (fingerprint, DesignSystemGenerator())
+    return _shared_generator[1]
+
+
+def _install_cache_dir() -> Path:
+    """This install's directory under DESIGN_CACHE_DIR, so installs sharing a cache never prune each other."""
+    install = f"{Path(__file__).resolve().parent}|{DATA_DIR.resolve()}"
+    return DESIGN_CACHE_DIR / f"{zlib.crc32(install.encode('utf-8')):08x}"
+
+
+def _read_design_cache(generation: str, key: str):
+    try:
+        with open(_install_cache_dir() / generation / f"{key}.json", 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _remove_cache_entry(entry: Path) -> None:
+    if entry.is_dir():
+        shutil.rmtree(entry, ignore_errors=True)
+    else:
+        try:
+            entry.unlink()
+        except OSError:
+            pass
+
+
+def _prune_design_cache(generation: str) -> None:
+    """
+    Remove this install's entries of every other generation (older data, code or config),
+    and other installs' directories (or pre-namespace files) unused for DESIGN_CACHE_STALE_DAYS.
+    """
+    global _pruned_generation
+    if _pruned_generation == generation:
+        return
+    _pruned_generation = generation
+    install_dir = _install_cache_dir()
+    try:
+        os.utime(install_dir)  # marks this install as in use for other installs' pruning
+        generations = list(install_dir.iterdir())
+        installs = list(DESIGN_CACHE_DIR.iterdir())
+    except OSError:
+        return
+    for entry in generations:
+        if entry.name != generation:
+            _remove_cache_entry(entry)
+    cutoff = time.time() - DESIGN_CACHE_STALE_DAYS * 86400
+    for entry in installs:
+        try:
+            stale = entry.name != install_dir.name and entry.stat().st_mtime < cutoff
+        except OSError:
+            continue
+        if stale:
+            _remove_cache_entry(entry)
+
+
+def _write_design_cache(generation: str, key: str, design_system: dict) -> None:
+    """Atomically store a cache entry under its generation; unwritable cache dirs are ignored."""
+    path = _install_cache_dir() / generation / f"{key}.json"
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(design_system, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError:
+        return
+    _prune_design_cache(generation)
+
+
+def generate_cached(query: str, project_name: str = None, disk_cache: bool = True) -> dict:
+    """
+    DesignSystemGenerator.generate() memoized by normalized query, project name,
+    data-file fingerprint and code_fingerprint(). Entries invalidate when any CSV
+    under data/, the search/generator code or the ranking config changes; on-disk
+    entries of older generations are pruned on the next write. Each install keeps
+    its entries in its own directory under DESIGN_CACHE_DIR.
+
+    Args:
+        query: Search query
+        project_name: Optional project name for output header
+        disk_cache: Also read/write entries under DESIGN_CACHE_DIR (shared across runs)
+
+    Returns:
+        Design system dict (a copy, safe to modify)
+    """
+    fingerprint = data_fingerprint()
+    generation = _cache_generation(fingerprint)
+    key = _design_cache_key(query, project_name, fingerprint)
+
+    design_system = _design_cache.get(key)
+    if design_system is None and disk_cache:
+        design_system = _read_design_cache(generation, key)
+    if design_system is None:
+        design_system = _get_generator(fingerprint).generate(query, project_name)
+        if disk_cache:
+            _write_design_cache(generation, key, design_system)
+
+    _design_cache[key] = design_system
+    _design_cache.move_to_end(key)
+    while len(_design_cache) > DESIGN_CACHE_MAX_ENTRIES:
+        _design_cache.popitem(last=False)
+    return copy.deepcopy(design_system)
+
+
 # ============ OUTPUT FORMATTERS ============
 BOX_WIDTH = 90  # Wider box for more content
 
@@ -460,7 +671,8 @@ def format_markdown(design_system: dict) -> str:
 
 # ============ MAIN ENTRY POINT ============
 def generate_design_system(query: str, project_name: str = None, output_format: str = "ascii", 
-                           persist: bool = False, page: str = None, output_dir: str = None) -> str:
+                           persist: bool = False, page: str = None, output_dir: str = None,
+                           use_cache: bool = True) -> str:
     """
     Main entry point for design system generation.
 
@@ -471,16 +683,19 @@ def generate_design_system(query: str, project_name: str = None, output_format:
         persist: If True, save design system to design-system/ folder
         page: Optional page name for page-specific override file
         output_dir: Optional output directory (defaults to current working directory)
+        use_cache: Reuse a memoized result for the same normalized query, data files and search code
 
     Returns:
         Formatted design system string
     """
-    generator = DesignSystemGenerator()
-    design_system = generator.generate(query, project_name)
+    if use_cache:
+        design_system = generate_cached(query, project_name)
+    else:
+        design_system = DesignSystemGenerator().generate(query, project_name)
     
     # Persist to files if requested
     if persist:
-        persist_design_system(design_system, page, output_dir, query)
+        persist_design_system(design_system, page, output_dir, query, query=query)
 
     if output_format == "markdown":
         return format_markdown(design_system)
@@ -488,57 +703,145 @@ def generate_design_system(query: str, project_name: str = None, output_format:
 
 
 # ============ PERSISTENCE FUNCTIONS ============
-def persist_design_system(design_system: dict, page: str = None, output_dir: str = None, page_query: str = None) -> dict:
+def persist_design_system(design_system: dict, page: str = None, output_dir: str = None, page_query: str = None,
+                          query: str = None) -> dict:
     """
     Persist design system to design-system/<project>/ folder using Master + Overrides pattern.
+
+    Files are only rewritten when their content (ignoring the Generated timestamp)
+    changed, and are replaced atomically. A .manifest.json next to MASTER.md records
+    the query, data fingerprint and content hash each file was generated from.
     
     Args:
         design_system: The generated design system dictionary
         page: Optional page name for page-specific override file
         output_dir: Optional output directory (defaults to current working directory)
         page_query: Optional query string for intelligent page override generation
+        query: Query the design system was generated from (defaults to page_query)
     
     Returns:
-        dict with created file paths and status
+        dict with created file paths, the subset left unchanged, and status
     """
     base_dir = Path(output_dir) if output_dir else Path.cwd()
     
     # Use project name for project-specific folder
-    project_name = design_system.get("project_name", "default")
-    project_slug = project_name.lower().replace(' ', '-')
-    
-    design_system_dir = base_dir / "design-system" / project_slug
+    design_system_dir = _project_dir(base_dir, design_system.get("project_name", "default"))
     pages_dir = design_system_dir / "pages"
     
     created_files = []
+    unchanged_files = []
     
     # Create directories
     design_system_dir.mkdir(parents=True, exist_ok=True)
     pages_dir.mkdir(parents=True, exist_ok=True)
-    
-    master_file = design_system_dir / "MASTER.md"
+
+    manifest = _read_manifest(design_system_dir)
+    manifest_before = json.dumps(manifest, sort_keys=True)
+    meta = {"query": query or page_query, "data_fingerprint": data_fingerprint()}
     
     # Generate and write MASTER.md
-    master_content = format_master_md(design_system)
-    with open(master_file, 'w', encoding='utf-8') as f:
-        f.write(master_content)
-    created_files.append(str(master_file))
+    outputs = [("MASTER.md", format_master_md(design_system), {"page": None})]
     
     # If page is specified, create page override file with intelligent content
     if page:
-        page_file = pages_dir / f"{page.lower().replace(' ', '-')}.md"
         page_content = format_page_override_md(design_system, page, page_query)
-        with open(page_file, 'w', encoding='utf-8') as f:
-            f.write(page_content)
-        created_files.append(str(page_file))
+        outputs.append((f"pages/{_page_filename(page)}", page_content, {"page": page, "page_query": page_query}))
+
+    for relpath, content, extra in outputs:
+        path = design_system_dir / relpath
+        if not _persist_file(design_system_dir, manifest, relpath, content, **meta, **extra):
+            unchanged_files.append(str(path))
+        created_files.append(str(path))
+
+    if json.dumps(manifest, sort_keys=True) != manifest_before:
+        _write_manifest(design_system_dir, manifest)
     
     return {
         "status": "success",
         "design_system_dir": str(design_system_dir),
-        "created_files": created_files
+        "created_files": created_files,
+        "unchanged_files": unchanged_files
     }
 
 
+def _project_slug(project_name: str) -> str:
+    return project_name.lower().replace(' ', '-')
+
+
+def _project_dir(base_dir: Path, project_name: str) -> Path:
+    """design-system/<project-slug>/ under base_dir."""
+    return base_dir / "design-system" / _project_slug(project_name)
+
+
+def _page_filename(page: str) -> str:
+    return f"{page.lower().replace(' ', '-')}.md"
+
+
+MANIFEST_FILE = ".manifest.json"
+_GENERATED_LINE = re.compile(r"^(> )?\*\*Generated:\*\* .*$", re.MULTILINE)
+
+
+def _content_digest(content: str) -> str:
+    """Hash of generated markdown, ignoring its Generated timestamp line."""
+    return hashlib.sha256(_GENERATED_LINE.sub(r"\1**Generated:**", content).encode('utf-8')).hexdigest()
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    """Write to a temp file in the same directory, then rename over the target."""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def _read_manifest(design_system_dir: Path) -> dict:
+    try:
+        with open(design_system_dir / MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {"files": {}}
+    return manifest if isinstance(manifest, dict) and isinstance(manifest.get("files"), dict) else {"files": {}}
+
+
+def _write_manifest(design_system_dir: Path, manifest: dict) -> None:
+    _write_atomic(design_system_dir / MANIFEST_FILE, json.dumps(manifest, indent=2, ensure_ascii=False, sort_keys=True) + "\n")
+
+
+def _file_digest(path: Path):
+    """_content_digest of a file on disk, or None when it cannot be read."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return _content_digest(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def _persist_file(design_system_dir: Path, manifest: dict, relpath: str, content: str, **meta) -> bool:
+    """
+    Write one generated file unless its content is unchanged, and record it in the manifest.
+
+    The manifest entry is replaced, not merged: metadata of an earlier run (such as
+    bulk "inputs") must not outlive the content it described.
+
+    Returns:
+        True if the file was (re)written
+    """
+    path = design_system_dir / relpath
+    digest = _content_digest(content)
+    generated = manifest["files"].get(relpath, {}).get("generated")
+
+    unchanged = _file_digest(path) == digest
+    if not unchanged:
+        _write_atomic(path, content)
+        generated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    manifest["files"][relpath] = {**meta, "sha256": digest, "generated": generated}
+    return not unchanged
+
+
 def format_master_md(design_system: dict) -> str:
     """Format design system as MASTER.md with hierarchical override logic."""
     project = design_system.get("project_name", "PROJECT")
@@ -918,16 +1221,16 @@ def _generate_intelligent_overrides(page_name: str, page_query: str, design_syst
     Uses the existing search infrastructure to find relevant style, UX, and layout
     data instead of hardcoded page types.
     """
-    from core import search
-    
     page_lower = page_name.lower()
     query_lower = (page_query or "").lower()
     combined_context = f"{page_lower} {query_lower}"
     
     # Search across multiple domains for page-specific guidance
-    style_search = search(combined_context, "style", max_results=1)
-    ux_search = search(combined_context, "ux", max_results=3)
-    landing_search = search(combined_context, "landing", max_results=1)
+    style_search, ux_search, landing_search = search_batch([
+        ("style", combined_context, 1),
+        ("ux", combined_context, 3),
+        ("landing", combined_context, 1),
+    ])
     
     # Extract results from search response
     style_results = style_search.get("results", [])
@@ -1052,6 +1355,202 @@ def _detect_page_type(context: str, style_results: list) -> str:
     return "General"
 
 
+# ============ BULK GENERATION ============
+def load_manifest(path: str) -> dict:
+    """
+    Load a bulk manifest (JSON, or YAML when PyYAML is installed).
+
+    Shape:
+        output_dir: optional base directory
+        projects:
+          - name: "Serenity Spa"               # unique per manifest (defaults to the query)
+            query: "beauty spa wellness service"
+            pages:
+              - dashboard                      # page query defaults to the project query
+              - name: booking
+                query: "appointment booking calendar"
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    if Path(path).suffix.lower() in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            raise RuntimeError("YAML manifests require PyYAML (pip install pyyaml); use JSON instead")
+        manifest = yaml.safe_load(text)
+    else:
+        manifest = json.loads(text)
+
+    validate_manifest(manifest, f"Manifest {path}")
+    return manifest
+
+
+def validate_manifest(manifest, source: str = "Manifest") -> None:
+    """Raise ValueError naming the project (and page) index of the first malformed entry."""
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("projects"), list):
+        raise ValueError(f"{source} must be a mapping with a 'projects' list")
+    slugs = {}  # project directory slug -> first project index using it
+    for index, project in enumerate(manifest["projects"]):
+        where = f"{source}: projects[{index}]"
+        if not isinstance(project, dict):
+            raise ValueError(f"{where} must be a mapping with a 'query', got {type(project).__name__}")
+        if not isinstance(project.get("query"), str) or not project["query"].strip():
+            raise ValueError(f"{where} is missing 'query'")
+        if project.get("name") is not None and not isinstance(project["name"], str):
+            raise ValueError(f"{where} 'name' must be a string")
+        # Projects sharing a directory would race on MASTER.md and .manifest.json in parallel workers
+        slug = _project_slug(project.get("name") or project["query"].upper())
+        if slug in slugs:
+            raise ValueError(f"{where} writes to design-system/{slug}/ like projects[{slugs[slug]}]; "
+                             f"merge their pages or rename one")
+        slugs[slug] = index
+        pages = project.get("pages") or []
+        if not isinstance(pages, list):
+            raise ValueError(f"{where} 'pages' must be a list")
+        filenames = {}  # page override filename -> first page index using it
+        for page_index, page in enumerate(pages):
+            if not (isinstance(page, str) and page.strip()):
+                if not isinstance(page, dict) or not isinstance(page.get("name"), str) or not page["name"].strip():
+                    raise ValueError(f"{where}.pages[{page_index}] is missing 'name'")
+                if page.get("query") is not None and not isinstance(page["query"], str):
+                    raise ValueError(f"{where}.pages[{page_index}] 'query' must be a string")
+            name = page if isinstance(page, str) else page["name"]
+            # Page names become pages/<name>.md: keep them inside the pages directory
+            if "/" in name or "\\" in name or ".." in name:
+                raise ValueError(f"{where}.pages[{page_index}] name {name!r} must not contain '/', '\\' or '..'")
+            filename = _page_filename(name)
+            if filename in filenames:
+                raise ValueError(f"{where}.pages[{page_index}] writes to pages/{filename} like "
+                                 f"pages[{filenames[filename]}]; rename one")
+            filenames[filename] = page_index
+
+
+def _normalize_pages(pages: list, default_query: str) -> list:
+    """[(page name, page query)] from manifest page entries (strings or mappings)."""
+    normalized = []
+    for page in pages or []:
+        if isinstance(page, str):
+            normalized.append((page, default_query))
+        else:
+            normalized.append((page["name"], page.get("query") or default_query))
+    return normalized
+
+
+def _generate_project(project: dict, base_dir: Path, fingerprint: str, force: bool) -> dict:
+    """Write MASTER.md and page overrides for one manifest project, skipping unchanged inputs."""
+    started = time.perf_counter()
+    query = project["query"]
+    if force:
+        design_system = _get_generator(fingerprint).generate(query, project.get("name"))
+    else:
+        design_system = generate_cached(query, project.get("name"))
+
+    design_system_dir = _project_dir(base_dir, design_system.get("project_name", "default"))
+    (design_system_dir / "pages").mkdir(parents=True, exist_ok=True)
+    manifest = _read_manifest(design_system_dir)
+    manifest_before = json.dumps(manifest, sort_keys=True)
+    meta = {"query": query, "data_fingerprint": fingerprint}
+
+    # Inputs of each file: the design system key (query, name, data, code and config
+    # fingerprints, see _cache_generation), plus page name/query for overrides
+    master_inputs = _design_cache_key(query, project.get("name"), fingerprint)
+    outputs = [("MASTER.md", master_inputs, {"page": None}, lambda: format_master_md(design_system))]
+    for page, page_query in _normalize_pages(project.get("pages"), query):
+        page_inputs = hashlib.sha1(json.dumps([master_inputs, page, _normalize_query(page_query)]).encode('utf-8')).hexdigest()
+        outputs.append((f"pages/{_page_filename(page)}", page_inputs, {"page": page, "page_query": page_query},
+                        lambda page=page, page_query=page_query: format_page_override_md(design_system, page, page_query)))
+
+    written, skipped = [], []
+    for relpath, inputs, extra, render in outputs:
+        path = design_system_dir / relpath
+        # Same inputs as last run and the file is still what was written: skip without even rendering
+        entry = manifest["files"].get(relpath, {})
+        if not force and entry.get("inputs") == inputs and _file_digest(path) == entry.get("sha256"):
+            skipped.append(str(path))
+            continue
+        if _persist_file(design_system_dir, manifest, relpath, render(), inputs=inputs, **meta, **extra):
+            written.append(str(path))
+        else:
+            skipped.append(str(path))
+
+    if json.dumps(manifest, sort_keys=True) != manifest_before:
+        _write_manifest(design_system_dir, manifest)
+
+    return {
+        "project": design_system.get("project_name"),
+        "query": query,
+        "design_system_dir": str(design_system_dir),
+        "written": written,
+        "skipped": skipped,
+        "seconds": round(time.perf_counter() - started, 4)
+    }
+
+
+def _generate_project_task(task: tuple) -> dict:
+    """Process-pool entry point (must be a picklable top-level function)."""
+    return _generate_project(*task)
+
+
+def _pool_context():
+    """Fork on Linux so workers inherit the parent's loaded indexes and generator."""
+    import multiprocessing
+    import sys
+
+    # macOS defaults to spawn because fork is unsafe with its system frameworks
+    if sys.platform.startswith("linux"):
+        return multiprocessing.get_context("fork")
+    # Spawned workers load the prebuilt on-disk indexes instead
+    return multiprocessing.get_context()
+
+
+def generate_bulk(manifest: dict, output_dir: str = None, force: bool = False, jobs: int = 1) -> dict:
+    """
+    Generate MASTER.md and page overrides for every project in a manifest.
+
+    Args:
+        manifest: Parsed manifest (see load_manifest)
+        output_dir: Base directory; overrides manifest["output_dir"], defaults to cwd
+        force: Regenerate and rewrite every file even if its inputs are unchanged
+        jobs: Worker processes; projects are independent and results keep manifest order
+
+    Returns:
+        dict with per-project reports (written/skipped files, seconds) and total seconds
+    """
+    started = time.perf_counter()
+    base_dir = Path(output_dir or manifest.get("output_dir") or Path.cwd())
+    validate_manifest(manifest)
+    fingerprint = data_fingerprint()
+    tasks = [(project, base_dir, fingerprint, force) for project in manifest["projects"]]
+
+    if jobs > 1 and len(tasks) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Build everything once in the parent; forked workers share it copy-on-write
+        preload_indexes()
+        _get_generator(fingerprint)
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks)), mp_context=_pool_context()) as executor:
+            projects = list(executor.map(_generate_project_task, tasks))
+    else:
+        projects = [_generate_project_task(task) for task in tasks]
+
+    return {
+        "status": "success",
+        "projects": projects,
+        "seconds": round(time.perf_counter() - started, 4)
+    }
+
+
+def format_bulk_report(report: dict) -> str:
+    """One line per project with timing and written/skipped counts."""
+    lines = []
+    for project in report["projects"]:
+        lines.append(f"{project['project']}: {project['seconds'] * 1000:.1f}ms, "
+                     f"{len(project['written'])} written, {len(project['skipped'])} unchanged "
+                     f"-> {project['design_system_dir']}")
+    lines.append(f"Total: {len(report['projects'])} projects in {report['seconds'] * 1000:.1f}ms")
+    return "\n".join(lines)
+
+
 # ============ CLI SUPPORT ============
 if __name__ == "__main__":
     import argparse
@@ -5,6 +5,11 @@ UI/UX Pro Max Search - BM25 search engine for UI/UX style guides
 Usage: python search.py "<query>" [--domain <domain>] [--stack <stack>] [--max-results 3]
        python search.py "<query>" --design-system [-p "Project Name"]
        python search.py "<query>" --design-system --persist [-p "Project Name"] [--page "dashboard"]
+       python search.py "<query>" --all [--include-stacks]   (one merged ranking across every domain)
+       python search.py --build-index
+       python search.py --serve [--stdio]
+       python search.py --batch queries.jsonl   (JSONL in: {query, domain?, stack?, max_results?}; JSONL out)
+       python search.py --bulk projects.yaml [-o <dir>] [--jobs N]   (many projects/pages in one run)
 
 Domains: style, prompt, color, chart, landing, product, ux, typography
 Stacks: html-tailwind, react, nextjs
@@ -12,13 +17,25 @@ Stacks: html-tailwind, react, nextjs
 Persistence (Master + Overrides pattern):
   --persist    Save design system to design-system/MASTER.md
   --page       Also create a page-specific override file in design-system/pages/
+  --bulk       Persist every project and page listed in a JSON/YAML manifest; unchanged inputs are skipped
+
+Indexes:
+  --build-index  Precompile BM25 indexes for all datasets (stale ones also rebuild on demand)
+
+Search server:
+  --serve      Keep indexes warm and answer JSON-line requests on a Unix socket (or --stdio)
+  Domain/stack searches are forwarded to a running server automatically (--no-daemon to skip)
 """
 
 import argparse
 import sys
 import io
-from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, search, search_stack
-from design_system import generate_design_system, persist_design_system
+from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, SEARCH_ENGINE, SEARCH_ENGINES, search, search_all, search_stack, set_search_engine
+from client import SOCKET_PATH, forward
+
+# Everything else (design_system, server, json) is imported only by the branch that
+# needs it: plain domain/stack searches are the hot path for agent hooks, see
+# bench_startup.py for the startup budget.
 
 # Force UTF-8 for stdout/stderr to handle emojis on Windows (cp1252 default)
 if sys.stdout.encoding and sys.stdout.encoding.lower() != 'utf-8':
@@ -39,7 +56,8 @@ def format_output(result):
     else:
         output.append(f"## UI Pro Max Search Results")
         output.append(f"**Domain:** {result['domain']} | **Query:** {result['query']}")
-    output.append(f"**Source:** {result['file']} | **Found:** {result['count']} results\n")
+    source = result['file'] if 'file' in result else f"{len(result['files'])} files"
+    output.append(f"**Source:** {source} | **Found:** {result['count']} results\n")
 
     for i, row in enumerate(result['results'], 1):
         output.append(f"### Result {i}")
@@ -55,11 +73,15 @@ def format_output(result):
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="UI Pro Max Search")
-    parser.add_argument("query", help="Search query")
+    parser.add_argument("query", nargs="?", help="Search query")
     parser.add_argument("--domain", "-d", choices=list(CSV_CONFIG.keys()), help="Search domain")
+    parser.add_argument("--detect-fallback", action="store_true", help="Without --domain: if no domain keyword matches, pick the domain whose index ranks the query best instead of style")
     parser.add_argument("--stack", "-s", choices=AVAILABLE_STACKS, help="Stack-specific search (html-tailwind, react, nextjs)")
+    parser.add_argument("--all", "-a", action="store_true", help="Federated search: one merged ranking across all domains")
+    parser.add_argument("--include-stacks", action="store_true", help="With --all: also search every stack")
     parser.add_argument("--max-results", "-n", type=int, default=MAX_RESULTS, help="Max results (default: 3)")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--engine", choices=SEARCH_ENGINES, default=SEARCH_ENGINE, help="Scoring engine; numpy falls back to python when NumPy is missing (default: python)")
     # Design system generation
     parser.add_argument("--design-system", "-ds", action="store_true", help="Generate complete design system recommendation")
     parser.add_argument("--project-name", "-p", type=str, default=None, help="Project name for design system output")
@@ -68,18 +90,73 @@ if __name__ == "__main__":
     parser.add_argument("--persist", action="store_true", help="Save design system to design-system/MASTER.md (creates hierarchical structure)")
     parser.add_argument("--page", type=str, default=None, help="Create page-specific override file in design-system/pages/")
     parser.add_argument("--output-dir", "-o", type=str, default=None, help="Output directory for persisted files (default: current directory)")
+    parser.add_argument("--no-cache", action="store_true", help="Regenerate the design system instead of reusing a cached result")
+    parser.add_argument("--bulk", type=str, default=None, metavar="MANIFEST", help="Generate design systems for all projects/pages in a JSON or YAML manifest")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="With --bulk: worker processes for independent projects (default: 1)")
+    # Index maintenance
+    parser.add_argument("--build-index", action="store_true", help="Precompile search indexes for all datasets and exit")
+    # Search server
+    parser.add_argument("--serve", action="store_true", help="Run a search server that keeps indexes warm")
+    parser.add_argument("--stdio", action="store_true", help="With --serve: use a JSON-line protocol on stdin/stdout instead of a socket")
+    parser.add_argument("--socket", type=str, default=SOCKET_PATH, help=f"Server socket path (default: {SOCKET_PATH})")
+    parser.add_argument("--no-daemon", action="store_true", help="Always search in-process, even if a server is running")
+    # Batch mode
+    parser.add_argument("--batch", type=str, default=None, metavar="FILE", help="Answer JSONL queries from FILE ('-' for stdin), one JSON result per line")
 
     args = parser.parse_args()
+    set_search_engine(args.engine)
+
+    if args.build_index:
+        from core import build_all_indexes
+        for path in build_all_indexes():
+            print(f"Built {path}")
+        sys.exit(0)
+    if args.serve:
+        from server import serve, serve_stdio
+        try:
+            if args.stdio:
+                serve_stdio()
+            else:
+                serve(args.socket)
+        except RuntimeError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        sys.exit(0)
+    if args.batch:
+        from server import run_batch
+        if args.batch == "-":
+            run_batch(sys.stdin, default_max_results=args.max_results)
+        else:
+            with open(args.batch, 'r', encoding='utf-8') as f:
+                run_batch(f, default_max_results=args.max_results)
+        sys.exit(0)
+    if args.bulk:
+        from design_system import load_manifest, generate_bulk, format_bulk_report
+        try:
+            report = generate_bulk(load_manifest(args.bulk), args.output_dir, force=args.no_cache, jobs=args.jobs)
+        except (OSError, ValueError, KeyError, RuntimeError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        if args.json:
+            import json
+            print(json.dumps(report, indent=2, ensure_ascii=False))
+        else:
+            print(format_bulk_report(report))
+        sys.exit(0)
+    if args.query is None:
+        parser.error("the following arguments are required: query")
 
     # Design system takes priority
     if args.design_system:
+        from design_system import generate_design_system
         result = generate_design_system(
             args.query, 
             args.project_name, 
             args.format,
             persist=args.persist,
             page=args.page,
-            output_dir=args.output_dir
+            output_dir=args.output_dir,
+            use_cache=not args.no_cache
         )
         print(result)
         
@@ -96,17 +173,23 @@ if __name__ == "__main__":
             print(f"📖 Usage: When building a page, check design-system/{project_slug}/pages/[page].md first.")
             print(f"   If exists, its rules override MASTER.md. Otherwise, use MASTER.md.")
             print("=" * 60)
-    # Stack search
-    elif args.stack:
-        result = search_stack(args.query, args.stack, args.max_results)
-        if args.json:
-            import json
-            print(json.dumps(result, indent=2, ensure_ascii=False))
-        else:
-            print(format_output(result))
-    # Domain search
+    # Stack / domain search, answered by a running server when there is one
     else:
-        result = search(args.query, args.domain, args.max_results)
+        if args.all:
+            request = {"query": args.query, "domain": "all", "include_stacks": args.include_stacks, "max_results": args.max_results}
+        else:
+            request = {"query": args.query, "domain": args.domain, "stack": args.stack, "max_results": args.max_results,
+                       "detect_fallback": args.detect_fallback}
+        request["engine"] = args.engine
+        result = None if args.no_daemon else forward(request, args.socket)
+        # Errors (e.g. a server running another engine) are re-answered in-process
+        if result is None or "error" in result:
+            if args.all:
+                result = search_all(args.query, args.max_results, args.include_stacks)
+            elif args.stack:
+                result = search_stack(args.query, args.stack, args.max_results)
+            else:
+                result = search(args.query, args.domain, args.max_results, args.detect_fallback)
         if args.json:
             import json
             print(json.dumps(result, indent=2, ensure_ascii=False))
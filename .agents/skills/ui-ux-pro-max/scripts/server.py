@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Search Server - keeps BM25 indexes warm between CLI invocations
+and answers JSONL batches in a single process
+
+Protocol: one JSON object per line in, one JSON object per line out.
+    {"query": "glassmorphism", "domain": "style", "max_results": 3}
+    {"query": "restaurant booking", "detect_fallback": true}   (no domain: auto-detect)
+    {"query": "form validation", "stack": "react"}
+    {"query": "dark dashboard", "domain": "all", "include_stacks": true}
+    {"query": "glassmorphism", "domain": "style", "engine": "numpy"}   (error unless the server runs that engine)
+    {"op": "ping"} / {"op": "stats"}
+Search responses are exactly what search()/search_stack()/search_all() return, i.e. the
+same payload search.py prints with --json.
+
+Usage:
+    python search.py --serve            # listen on a Unix domain socket
+    python search.py --serve --stdio    # line protocol over stdin/stdout
+    python search.py --batch queries.jsonl   # one-shot batch, '-' reads stdin
+"""
+
+import json
+import os
+import signal
+import sys
+import core
+from core import CSV_CONFIG, MAX_RESULTS, search, search_all, search_stack, preload_indexes, index_cache_info
+from client import SOCKET_PATH, _owned_socket, ping
+
+
+# ============ REQUEST HANDLING ============
+def handle_request(request: dict, default_max_results: int = MAX_RESULTS) -> dict:
+    """Answer one protocol request with the same payload as search.py --json."""
+    if not isinstance(request, dict):
+        return {"error": "Request must be a JSON object"}
+
+    op = request.get("op", "search")
+    if op == "ping":
+        return {"ok": True, "pid": os.getpid()}
+    if op == "stats":
+        return index_cache_info()
+    if op != "search":
+        return {"error": f"Unknown op: {op}"}
+
+    query = request.get("query")
+    if not isinstance(query, str):
+        return {"error": "Missing query"}
+    max_results = request.get("max_results")
+    if max_results is None:
+        max_results = default_max_results
+    if not isinstance(max_results, int):
+        return {"error": f"Invalid max_results: {max_results}"}
+    engine = request.get("engine")
+    if engine is not None and engine != core.SEARCH_ENGINE:
+        return {"error": f"Server uses the {core.SEARCH_ENGINE} engine, not {engine}"}
+
+    if request.get("stack"):
+        return search_stack(query, request["stack"], max_results)
+    domain = request.get("domain")
+    if domain == "all":
+        return search_all(query, max_results, bool(request.get("include_stacks")))
+    if domain is not None and domain not in CSV_CONFIG:
+        return {"error": f"Unknown domain: {domain}. Available: {', '.join(CSV_CONFIG)}"}
+    return search(query, domain, max_results, bool(request.get("detect_fallback")))
+
+
+def _handle_line(line: str, default_max_results: int = MAX_RESULTS) -> str:
+    """Decode a request line and encode its response line."""
+    try:
+        request = json.loads(line)
+    except json.JSONDecodeError as e:
+        response = {"error": f"Invalid JSON: {e}"}
+    else:
+        response = handle_request(request, default_max_results)
+    return json.dumps(response, ensure_ascii=False) + "\n"
+
+
+def _answer_lines(lines, out, default_max_results: int = MAX_RESULTS) -> int:
+    """Write one response line per non-blank request line; returns the count."""
+    count = 0
+    for line in lines:
+        if line.strip():
+            out.write(_handle_line(line, default_max_results))
+            out.flush()
+            count += 1
+    return count
+
+
+def run_batch(lines, out=None, default_max_results: int = MAX_RESULTS) -> int:
+    """Answer a JSONL batch in-process, loading each index only once."""
+    return _answer_lines(lines, out or sys.stdout, default_max_results)
+
+
+# ============ SERVER ============
+def serve_stdio(stdin=None, stdout=None) -> None:
+    """Serve the line protocol over stdin/stdout until EOF."""
+    preload_indexes()
+    _answer_lines(stdin or sys.stdin, stdout or sys.stdout)
+
+
+def serve(socket_path: str = SOCKET_PATH) -> None:
+    """Serve the line protocol on a Unix domain socket until interrupted."""
+    import socketserver
+
+    if not hasattr(socketserver, "ThreadingUnixStreamServer"):
+        raise RuntimeError("Unix domain sockets are not available on this platform; use --stdio")
+
+    if os.path.lexists(socket_path):
+        # Never remove a regular file, a symlink or another user's socket
+        if not _owned_socket(socket_path):
+            raise RuntimeError(f"{socket_path} exists and is not a socket owned by this user; remove it or pass --socket")
+        if ping(socket_path):
+            raise RuntimeError(f"A search server is already listening on {socket_path}")
+        os.unlink(socket_path)  # stale socket left by a crashed server
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for raw in self.rfile:
+                line = raw.decode("utf-8")
+                if line.strip():
+                    self.wfile.write(_handle_line(line).encode("utf-8"))
+                    self.wfile.flush()
+
+    preload_indexes()
+
+    # Socket is only accessible to the current user
+    old_umask = os.umask(0o177)
+    try:
+        server = socketserver.ThreadingUnixStreamServer(socket_path, Handler)
+    finally:
+        os.umask(old_umask)
+    bound = os.lstat(socket_path)
+    server.daemon_threads = True
+    # Treat SIGTERM like Ctrl+C so the socket file is cleaned up
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        # Only remove our own socket: not a file swapped in since, nor another server's socket
+        try:
+            if _owned_socket(socket_path) and os.path.samestat(os.lstat(socket_path), bound):
+                os.unlink(socket_path)
+        except OSError:
+            pass
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Search engine tests - the optimised code paths against reference copies of the
+implementations they replaced, over every CSV under data/ and data/stacks/
+
+Usage:
+    python -m pytest test_core.py -q
+"""
+
+import csv
+import os
+import random
+import re
+from collections import defaultdict
+from math import log
+from pathlib import Path
+
+import pytest
+
+import core
+from core import BM25, BM25F, DATA_DIR, DOMAIN_KEYWORDS, RowStore, SparseBM25, Tokenizer, detect_domain
+from design_system import DesignSystemGenerator
+
+
+# ============ REFERENCE IMPLEMENTATIONS ============
+class ReferenceBM25:
+    """The original per-document BM25 scorer (before the inverted index)"""
+
+    def __init__(self, k1=1.5, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self.corpus = []
+        self.doc_lengths = []
+        self.avgdl = 0
+        self.idf = {}
+        self.doc_freqs = defaultdict(int)
+        self.N = 0
+
+    def tokenize(self, text):
+        text = re.sub(r'[^\w\s]', ' ', str(text).lower())
+        return [w for w in text.split() if len(w) > 2]
+
+    def fit(self, documents):
+        self.corpus = [self.tokenize(doc) for doc in documents]
+        self.N = len(self.corpus)
+        if self.N == 0:
+            return
+        self.doc_lengths = [len(doc) for doc in self.corpus]
+        self.avgdl = sum(self.doc_lengths) / self.N
+        for doc in self.corpus:
+            for word in set(doc):
+                self.doc_freqs[word] += 1
+        for word, freq in self.doc_freqs.items():
+            self.idf[word] = log((self.N - freq + 0.5) / (freq + 0.5) + 1)
+
+    def score(self, query):
+        query_tokens = self.tokenize(query)
+        scores = []
+        for idx, doc in enumerate(self.corpus):
+            score = 0
+            doc_len = self.doc_lengths[idx]
+            term_freqs = defaultdict(int)
+            for word in doc:
+                term_freqs[word] += 1
+            for token in query_tokens:
+                if token in self.idf:
+                    tf = term_freqs[token]
+                    numerator = tf * (self.k1 + 1)
+                    denominator = tf + self.k1 * (1 - self.b + self.b * doc_len / self.avgdl)
+                    score += self.idf[token] * numerator / denominator
+            scores.append((idx, score))
+        return sorted(scores, key=lambda x: x[1], reverse=True)
+
+
+def reference_detect_domain(query):
+    """The original keyword loop: one substring test per keyword"""
+    query_lower = query.lower()
+    scores = {domain: sum(1 for kw in keywords if kw in query_lower) for domain, keywords in DOMAIN_KEYWORDS.items()}
+    best = max(scores, key=scores.get)
+    return best if scores[best] > 0 else "style"
+
+
+def reference_reasoning_rule(reasoning_data, category):
+    """The original three-tier scan over ui-reasoning.csv: exact, partial, keyword"""
+    category_lower = category.lower()
+    for rule in reasoning_data:
+        if rule.get("UI_Category", "").lower() == category_lower:
+            return rule
+    for rule in reasoning_data:
+        ui_cat = rule.get("UI_Category", "").lower()
+        if ui_cat in category_lower or category_lower in ui_cat:
+            return rule
+    for rule in reasoning_data:
+        keywords = rule.get("UI_Category", "").lower().replace("/", " ").replace("-", " ").split()
+        if any(kw in category_lower for kw in keywords):
+            return rule
+    return {}
+
+
+# ============ FIXTURES ============
+def _targets():
+    """(relative path, search columns, field weights) for every CSV; unconfigured ones search all columns"""
+    configured = {filepath.resolve(): (cols, weights) for filepath, cols, weights in core._dataset_targets()}
+    targets = []
+    for filepath in sorted(list(DATA_DIR.glob("*.csv")) + list(DATA_DIR.glob("stacks/*.csv"))):
+        if filepath.resolve() in configured:
+            search_cols, field_weights = configured[filepath.resolve()]
+        else:
+            search_cols, field_weights = list(RowStore.from_csv(filepath).columns), None
+        targets.append((filepath.relative_to(DATA_DIR).as_posix(), search_cols, field_weights))
+    return targets
+
+
+TARGETS = _targets()
+
+
+@pytest.fixture(params=TARGETS, ids=[relpath for relpath, _, _ in TARGETS])
+def target(request):
+    relpath, search_cols, field_weights = request.param
+    return RowStore.from_csv(DATA_DIR / relpath), search_cols, field_weights, DATA_DIR / relpath
+
+
+def sample_queries(documents, count=40, seed=7):
+    """Seeded queries from a corpus' own words, plus case/punctuation variants, repeats and misses"""
+    rng = random.Random(seed)
+    vocabulary = sorted({word for doc in documents for word in re.findall(r'\w+', str(doc).lower())})
+    queries = ["", "zzzz-no-such-term", "a an of"]
+    for _ in range(count):
+        words = rng.sample(vocabulary, min(len(vocabulary), rng.randint(1, 4)))
+        if rng.random() < 0.3:
+            words.append(words[0])  # repeated query tokens count twice
+        query = " ".join(words)
+        queries.append(query.upper() + "!" if rng.random() < 0.2 else query)
+    return queries
+
+
+def _documents(rows, search_cols):
+    return [rows.document(idx, search_cols) for idx in range(len(rows))]
+
+
+def _fitted(rows, search_cols, field_weights):
+    """The model build_index stores for this CSV, without touching the on-disk index cache"""
+    tokenizer = Tokenizer(**core.TOKENIZER_OPTIONS)
+    fields = core._field_params(search_cols, field_weights)
+    if fields:
+        bm25 = BM25F(fields, tokenizer=tokenizer)
+        bm25.fit([[rows.value(idx, col) for col in search_cols] for idx in range(len(rows))])
+    else:
+        bm25 = BM25(tokenizer=tokenizer)
+        bm25.fit(_documents(rows, search_cols))
+    return bm25
+
+
+# ============ BM25 ============
+def test_score_matches_reference_scorer(target):
+    rows, search_cols, _, _ = target
+    documents = _documents(rows, search_cols)
+    bm25, reference = BM25(), ReferenceBM25()
+    bm25.fit(documents)
+    reference.fit(documents)
+    for query in sample_queries(documents):
+        assert bm25.score(query) == reference.score(query), query
+
+
+def test_score_topk_matches_reference_ranking(target):
+    rows, search_cols, _, _ = target
+    documents = _documents(rows, search_cols)
+    bm25, reference = BM25(), ReferenceBM25()
+    bm25.fit(documents)
+    reference.fit(documents)
+    for query in sample_queries(documents):
+        positive = [(idx, score) for idx, score in reference.score(query) if score > 0]
+        for k in (0, 1, 3, 10):
+            assert bm25.score_topk(query, k) == positive[:k], (query, k)
+
+
+def test_score_topk_ties_resolve_in_row_order():
+    bm25 = BM25()
+    bm25.fit(["glass card", "solid panel", "glass card", "glass card", "dark glass"])
+    ranked = bm25.score_topk("glass card", 3)
+    assert [idx for idx, _ in ranked] == [0, 2, 3]
+    assert len({score for _, score in ranked}) == 1
+
+
+def test_sparse_engine_matches_bm25(target):
+    pytest.importorskip("numpy")
+    rows, search_cols, field_weights, _ = target
+    bm25 = _fitted(rows, search_cols, field_weights)
+    sparse = SparseBM25(bm25)
+    queries = sample_queries(_documents(rows, search_cols))
+    for query in queries:
+        assert sparse.score_topk(query, 5) == bm25.score_topk(query, 5), query
+        assert sparse.score(query) == bm25.score(query), query
+    assert sparse.score_batch(queries, 3) == bm25.score_batch(queries, 3)
+
+
+# ============ INDEX FILES ============
+@pytest.fixture
+def index_csv(tmp_path, monkeypatch):
+    """A small CSV with its compiled indexes under tmp_path; counts build_index calls"""
+    monkeypatch.setattr(core, "INDEX_DIR", tmp_path / "index")
+    builds = []
+    build_index = core.build_index
+    monkeypatch.setattr(core, "build_index", lambda *args: builds.append(args) or build_index(*args))
+    filepath = tmp_path / "rows.csv"
+    filepath.write_text("Name,Notes\nglass card,frosted panel\nsolid panel,flat colour\n", encoding="utf-8")
+    return filepath, builds
+
+
+def _touch(filepath, seconds=10):
+    stat = filepath.stat()
+    os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 10 ** 9))
+
+
+def test_load_index_rebuilds_when_csv_content_changes(index_csv):
+    filepath, builds = index_csv
+    first = core.load_index(filepath, ["Name", "Notes"])
+    assert len(builds) == 1 and core._index_path(filepath, ["Name", "Notes"]).exists()
+    assert core.load_index(filepath, ["Name", "Notes"])["sha1"] == first["sha1"]
+    assert len(builds) == 1
+
+    # Same size, new content: the sha1 check catches what (size, mtime) alone might not
+    filepath.write_text("Name,Notes\nneon badge,frosted panel\nsolid panel,flat colour\n", encoding="utf-8")
+    _touch(filepath)
+    second = core.load_index(filepath, ["Name", "Notes"])
+    assert len(builds) == 2
+    assert second["sha1"] != first["sha1"]
+    assert second["bm25"].score_topk("neon", 1)[0][0] == 0
+
+
+def test_load_index_only_refreshes_fingerprint_when_csv_is_touched(index_csv):
+    filepath, builds = index_csv
+    first = core.load_index(filepath, ["Name", "Notes"])
+    _touch(filepath)
+    touched = core.load_index(filepath, ["Name", "Notes"])
+    assert len(builds) == 1
+    assert touched["sha1"] == first["sha1"]
+    assert (touched["size"], touched["mtime_ns"]) == core._file_fingerprint(filepath)
+
+    # The refreshed fingerprint was written back, so the next load is a plain hit
+    core.load_index(filepath, ["Name", "Notes"])
+    assert len(builds) == 1
+
+def test_index_cache_evicts_least_recently_used_within_budget(tmp_path, monkeypatch):
+    monkeypatch.setattr(core, "INDEX_DIR", tmp_path / "index")
+    monkeypatch.setattr(core, "INDEX_CACHE_MAX_ENTRIES", core.INDEX_CACHE_MAX_ENTRIES)
+    monkeypatch.setattr(core, "INDEX_CACHE_MAX_SOURCE_BYTES", core.INDEX_CACHE_MAX_SOURCE_BYTES)
+    files = []
+    for name in ("a", "b", "c"):
+        filepath = tmp_path / f"{name}.csv"
+        filepath.write_text(f"Name\n{name}-row one\n{name}-row two\n", encoding="utf-8")
+        files.append(filepath)
+    size = files[0].stat().st_size
+
+    core.index_cache_clear()
+    try:
+        core.configure_index_cache(max_entries=2)
+        for filepath in files:
+            core.get_index(filepath, ["Name"])
+        core.get_index(files[1], ["Name"])
+        info = core.index_cache_info()
+        assert (info["entries"], info["evictions"], info["hits"], info["misses"]) == (2, 1, 1, 3)
+        assert [Path(key[0]) for key in core._index_cache] == [files[2], files[1]]
+
+        # The size budget counts source CSV bytes; shrinking it evicts immediately, oldest first
+        core.configure_index_cache(max_entries=10, max_source_bytes=size)
+        info = core.index_cache_info()
+        assert (info["entries"], info["source_bytes"], info["evictions"]) == (1, size, 2)
+        assert [Path(key[0]) for key in core._index_cache] == [files[1]]
+    finally:
+        core.index_cache_clear()
+
+# ============ ROW STORE ============
+def test_rowstore_matches_dictreader(target):
+    rows, _, _, filepath = target
+    with open(filepath, 'r', encoding='utf-8', newline='') as f:
+        expected = list(csv.DictReader(f))
+    assert len(rows) == len(expected)
+    for idx, row in enumerate(expected):
+        assert rows.materialize(idx, rows.columns) == {col: row[col] for col in rows.columns}
+
+
+# ============ DOMAIN DETECTION ============
+def test_detect_domain_matches_keyword_loop():
+    rng = random.Random(19)
+    keywords = [kw for domain_keywords in DOMAIN_KEYWORDS.values() for kw in domain_keywords]
+    filler = ["modern", "app", "for", "kids", "x", "#fff", "dash", "board", "ui-kit", "Next.JS", "bar chart"]
+    queries = ["", "nothing relevant here"] + keywords
+    for _ in range(3000):
+        parts = rng.sample(keywords, rng.randint(1, 4)) + rng.sample(filler, rng.randint(0, 3))
+        rng.shuffle(parts)
+        # Joining without spaces creates overlapping and nested keyword occurrences
+        queries.append(("" if rng.random() < 0.3 else " ").join(parts))
+    for query in queries:
+        assert detect_domain(query) == reference_detect_domain(query), query
+
+
+# ============ REASONING RULES ============
+def test_reasoning_rule_tiers_match_reference():
+    generator = DesignSystemGenerator()
+    rules = generator.reasoning_data
+    categories = [rule.get("UI_Category", "") for rule in rules]
+    products = RowStore.from_csv(DATA_DIR / "products.csv")
+    categories += [products.value(idx, "Product Type") for idx in range(len(products))]
+
+    rng = random.Random(12)
+    words = sorted({word for category in categories for word in re.split(r'[\s/-]+', category) if word})
+    for _ in range(2000):
+        categories.append(rng.choice(["", " ", "/", "-"]).join(rng.sample(words, rng.randint(1, 3))))
+    categories += ["", "Unknown Category", categories[0].upper(), categories[0][:4]]
+
+    for category in categories:
+        assert generator._find_reasoning_rule(category) == reference_reasoning_rule(rules, category), category
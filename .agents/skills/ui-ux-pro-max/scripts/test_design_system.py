@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Design system tests - the generate() memo and its on-disk cache
+
+Usage:
+    python -m pytest test_design_system.py -q
+"""
+
+import os
+import time
+
+import pytest
+
+import design_system
+from design_system import generate_cached
+
+
+# ============ FIXTURES ============
+@pytest.fixture
+def design_cache(tmp_path, monkeypatch):
+    """An empty memo and DESIGN_CACHE_DIR under tmp_path; records generate() calls"""
+    monkeypatch.setattr(design_system, "DESIGN_CACHE_DIR", tmp_path / "design-system")
+    monkeypatch.setattr(design_system, "_design_cache", design_system.OrderedDict())
+    monkeypatch.setattr(design_system, "_pruned_generation", None)
+    calls = []
+    generate = design_system.DesignSystemGenerator.generate
+    monkeypatch.setattr(design_system.DesignSystemGenerator, "generate",
+                        lambda self, *args: calls.append(args) or generate(self, *args))
+    return tmp_path / "design-system", calls
+
+
+def _age(path, days):
+    past = time.time() - days * 86400
+    os.utime(path, (past, past))
+
+
+# ============ MEMOIZED GENERATION ============
+def test_data_change_starts_a_new_generation(design_cache, monkeypatch):
+    _, calls = design_cache
+    first = generate_cached("beauty spa wellness")
+    assert generate_cached("beauty spa wellness") == first
+    assert len(calls) == 1
+
+    install_dir = design_system._install_cache_dir()
+    old_generation = design_system._cache_generation(design_system.data_fingerprint())
+    assert [entry.name for entry in install_dir.iterdir()] == [old_generation]
+
+    # Any CSV change alters the data fingerprint: regenerate, and drop the old generation
+    monkeypatch.setattr(design_system, "data_fingerprint", lambda: "edited-data")
+    assert generate_cached("beauty spa wellness") == first
+    assert len(calls) == 2
+    assert [entry.name for entry in install_dir.iterdir()] == [design_system._cache_generation("edited-data")]
+
+
+def test_cache_version_bump_invalidates_memo_and_disk_entries(design_cache, monkeypatch):
+    _, calls = design_cache
+    generate_cached("beauty spa wellness")
+    old_key = design_system._design_cache_key("beauty spa wellness", None, design_system.data_fingerprint())
+
+    monkeypatch.setattr(design_system, "DESIGN_CACHE_VERSION", design_system.DESIGN_CACHE_VERSION + 1)
+    assert design_system._design_cache_key("beauty spa wellness", None, design_system.data_fingerprint()) != old_key
+    generate_cached("beauty spa wellness")
+    assert len(calls) == 2
+
+    # The new entry is served from disk after a restart, and the old version's entries are pruned
+    design_system._design_cache.clear()
+    generate_cached("beauty spa wellness")
+    assert len(calls) == 2
+    generations = [entry.name for entry in design_system._install_cache_dir().iterdir()]
+    assert generations == [design_system._cache_generation(design_system.data_fingerprint())]
+
+def test_other_installs_are_only_pruned_when_unused(design_cache):
+    cache_dir, _ = design_cache
+    active, abandoned, legacy = cache_dir / "0000beef", cache_dir / "0000dead", cache_dir / "0123456789abcdef"
+    for directory in (active, abandoned, legacy):
+        (directory / "generation").mkdir(parents=True)
+        (directory / "generation" / "entry.json").write_text("{}", encoding="utf-8")
+    _age(abandoned, design_system.DESIGN_CACHE_STALE_DAYS + 1)
+    _age(legacy, design_system.DESIGN_CACHE_STALE_DAYS + 1)
+
+    generate_cached("beauty spa wellness")
+    remaining = sorted(entry.name for entry in cache_dir.iterdir())
+    assert remaining == sorted([active.name, design_system._install_cache_dir().name])
+    assert (active / "generation" / "entry.json").exists()
+
+
+# ============ BULK GENERATION ============
+SPA = {"name": "Spa One", "query": "beauty spa wellness", "pages": ["Booking"]}
+
+
+@pytest.mark.parametrize("manifest, message", [
+    ({"projects": {}}, "must be a mapping with a 'projects' list"),
+    ({"projects": [{"name": "Spa"}]}, "projects[0] is missing 'query'"),
+    ({"projects": [{"query": "spa"}, {"query": "SPA"}]}, "projects[1] writes to design-system/spa/ like projects[0]"),
+    ({"projects": [{"query": "spa", "pages": [{"query": "booking"}]}]}, "projects[0].pages[0] is missing 'name'"),
+    ({"projects": [{"query": "spa", "pages": ["../../MASTER"]}]}, "must not contain '/', '\\' or '..'"),
+    ({"projects": [{"query": "spa", "pages": ["a\\b"]}]}, "must not contain '/', '\\' or '..'"),
+    ({"projects": [{"query": "spa", "pages": ["Check Out", {"name": "check-out"}]}]},
+     "projects[0].pages[1] writes to pages/check-out.md like pages[0]"),
+])
+def test_validate_manifest_rejects_malformed_entries(manifest, message):
+    with pytest.raises(ValueError) as error:
+        design_system.validate_manifest(manifest)
+    assert message in str(error.value)
+
+
+def _bulk(tmp_path):
+    report = design_system.generate_bulk({"projects": [SPA]}, output_dir=str(tmp_path))
+    project = report["projects"][0]
+    return project, [os.path.relpath(path, project["design_system_dir"]) for path in project["written"]]
+
+
+def test_bulk_skips_unchanged_files_and_repairs_edited_ones(design_cache, tmp_path):
+    project, written = _bulk(tmp_path)
+    assert sorted(written) == ["MASTER.md", os.path.join("pages", "booking.md")]
+    master = os.path.join(project["design_system_dir"], "MASTER.md")
+    with open(master, encoding="utf-8") as f:
+        generated = design_system._content_digest(f.read())
+
+    assert _bulk(tmp_path)[1] == []
+
+    # Same inputs, but the file on disk no longer matches the manifest: rewrite it
+    with open(master, "a", encoding="utf-8") as f:
+        f.write("\nhand edit\n")
+    assert _bulk(tmp_path)[1] == ["MASTER.md"]
+    with open(master, encoding="utf-8") as f:
+        assert design_system._content_digest(f.read()) == generated
+
+
+def test_single_persist_invalidates_bulk_inputs(design_cache, tmp_path):
+    project, _ = _bulk(tmp_path)
+    master = os.path.join(project["design_system_dir"], "MASTER.md")
+    with open(master, encoding="utf-8") as f:
+        bulk_content = design_system._content_digest(f.read())
+
+    # A --persist for the same project but another query replaces MASTER.md and its manifest entry
+    other = generate_cached("fintech crypto exchange", SPA["name"])
+    design_system.persist_design_system(other, output_dir=str(tmp_path), query="fintech crypto exchange")
+    entry = design_system._read_manifest(tmp_path / "design-system" / "spa-one")["files"]["MASTER.md"]
+    assert "inputs" not in entry and entry["query"] == "fintech crypto exchange"
+
+    assert _bulk(tmp_path)[1] == ["MASTER.md"]
+    with open(master, encoding="utf-8") as f:
+        assert design_system._content_digest(f.read()) == bulk_content
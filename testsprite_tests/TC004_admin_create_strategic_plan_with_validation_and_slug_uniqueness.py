@@ -1,46 +1,13 @@
-import requests
 import uuid
 
-BASE_URL = "http://localhost:3000"
+from admin_session import BASE_URL, get_admin_session
+
 STRATEGIC_PLAN_URL = f"{BASE_URL}/api/strategic-plan"
-AUTH_CSRF_URL = f"{BASE_URL}/api/auth/csrf"
-AUTH_CALLBACK_URL = f"{BASE_URL}/api/auth/callback/credentials"
 TIMEOUT = 30
 
 
-def get_auth_session():
-    try:
-        # Step a: get csrf token
-        r = requests.get(AUTH_CSRF_URL, timeout=TIMEOUT)
-        r.raise_for_status()
-        csrf_token = r.json().get("csrfToken")
-        if not csrf_token:
-            raise Exception("csrfToken not found in csrf response")
-
-        # Step b: authenticate with credentials
-        form_data = {
-            "csrfToken": csrf_token,
-            "email": "admin@example.com",
-            "password": "Admin@123456",
-            "json": "true",
-            "redirect": "false",
-        }
-        r2 = requests.post(AUTH_CALLBACK_URL, data=form_data, timeout=TIMEOUT)
-        r2.raise_for_status()
-
-        # Step c: capture session cookie
-        cookies = r2.cookies
-        # check for cookies starting with expected prefixes
-        if not any(c.name.startswith(prefix) for c in cookies for prefix in ["next-auth.session-token", "__Secure-next-auth.session-token"]):
-            raise Exception("Session cookie not found in authentication response")
-
-        return cookies
-    except Exception as e:
-        raise Exception(f"Authentication failed: {e}")
-
-
 def test_admin_create_strategic_plan_with_validation_and_slug_uniqueness():
-    session_cookies = get_auth_session()
+    session = get_admin_session()
 
     headers = {"Content-Type": "application/json"}
 
@@ -53,14 +20,14 @@ def test_admin_create_strategic_plan_with_validation_and_slug_uniqueness():
         if not plan_id:
             return
         try:
-            del_res = requests.delete(f"{STRATEGIC_PLAN_URL}/{plan_id}", cookies=session_cookies, timeout=TIMEOUT)
+            del_res = session.delete(f"{STRATEGIC_PLAN_URL}/{plan_id}", timeout=TIMEOUT)
             del_res.raise_for_status()
         except Exception:
             pass
 
     try:
         # 1) Validate required fields: send empty payload => expect 400 or validation error
-        resp = requests.post(STRATEGIC_PLAN_URL, json={}, cookies=session_cookies, headers=headers, timeout=TIMEOUT)
+        resp = session.post(STRATEGIC_PLAN_URL, json={}, headers=headers, timeout=TIMEOUT)
         assert resp.status_code == 400 or resp.status_code == 422, (
             f"Expected 400 or 422 when required fields missing but got {resp.status_code}"
         )
@@ -76,7 +43,7 @@ def test_admin_create_strategic_plan_with_validation_and_slug_uniqueness():
             "priority": "HIGH",
             "status": "DRAFT",
         }
-        resp = requests.post(STRATEGIC_PLAN_URL, json=payload, cookies=session_cookies, headers=headers, timeout=TIMEOUT)
+        resp = session.post(STRATEGIC_PLAN_URL, json=payload, headers=headers, timeout=TIMEOUT)
         assert resp.status_code == 201, f"Expected 201 on creation but got {resp.status_code}"
         created_plan = resp.json()
         created_plan_id = created_plan.get("id") or created_plan.get("_id") or created_plan.get("ID") or created_plan.get("planId")
@@ -90,7 +57,7 @@ def test_admin_create_strategic_plan_with_validation_and_slug_uniqueness():
             "priority": "LOW",
             "status": "DRAFT",
         }
-        resp_dup = requests.post(STRATEGIC_PLAN_URL, json=payload_duplicate_slug, cookies=session_cookies, headers=headers, timeout=TIMEOUT)
+        resp_dup = session.post(STRATEGIC_PLAN_URL, json=payload_duplicate_slug, headers=headers, timeout=TIMEOUT)
         # Expect failure status code 400 or 409 or 422 for slug uniqueness violation
         assert resp_dup.status_code in (400, 409, 422), f"Expected 400, 409 or 422 for duplicate slug but got {resp_dup.status_code}"
 
@@ -107,7 +74,7 @@ def test_admin_create_strategic_plan_with_validation_and_slug_uniqueness():
             "priority": "MEDIUM",
             "status": "UNDER_REVIEW",
         }
-        resp2 = requests.post(STRATEGIC_PLAN_URL, json=payload2, cookies=session_cookies, headers=headers, timeout=TIMEOUT)
+        resp2 = session.post(STRATEGIC_PLAN_URL, json=payload2, headers=headers, timeout=TIMEOUT)
         assert resp2.status_code == 201, f"Expected 201 on creation of unique slug but got {resp2.status_code}"
         created_plan_2 = resp2.json()
         created_plan_id_2 = created_plan_2.get("id") or created_plan_2.get("_id") or created_plan_2.get("ID") or created_plan_2.get("planId")
@@ -1,42 +1,12 @@
-import requests
+# testsprite: serial
+# Uses fixed slugs (initial-test-plan, conflicting-plan, updated-test-plan); must not overlap with another run of itself.
 from requests.exceptions import RequestException
 import json
 
-BASE_AUTH_URL = "http://localhost:3000/api/auth"
-BASE_STRATEGIC_PLAN_URL = "http://localhost:3000/api/strategic-plan"
-ADMIN_EMAIL = "admin@example.com"
-ADMIN_PASSWORD = "Admin@123456"
-TIMEOUT = 30
-
-def authenticate_admin():
-    session = requests.Session()
-    try:
-        # Step a) Get CSRF token
-        r = session.get(f"{BASE_AUTH_URL}/csrf", timeout=TIMEOUT)
-        r.raise_for_status()
-        csrf_token = r.json().get("csrfToken")
-        assert csrf_token, "No csrfToken found in CSRF response"
-
-        # Step b) Post credentials to callback
-        payload = {
-            "csrfToken": csrf_token,
-            "email": ADMIN_EMAIL,
-            "password": ADMIN_PASSWORD,
-            "json": "true",
-            "redirect": "false"
-        }
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
-        r = session.post(f"{BASE_AUTH_URL}/callback/credentials", data=payload, headers=headers, timeout=TIMEOUT)
-        r.raise_for_status()
-        resp_json = r.json()
-        assert resp_json.get("ok") is True or resp_json.get("status") == "OK" or r.status_code == 200, "Authentication failed"
+from admin_session import BASE_URL, get_admin_session
 
-        # Session cookie is stored automatically in session
-        return session
-    except (RequestException, AssertionError) as e:
-        raise RuntimeError(f"Admin authentication failed: {e}")
+BASE_STRATEGIC_PLAN_URL = f"{BASE_URL}/api/strategic-plan"
+TIMEOUT = 30
 
 def create_strategic_plan(session, plan_data):
     try:
@@ -60,7 +30,7 @@ def delete_strategic_plan(session, plan_id):
         pass
 
 def admin_update_strategic_plan_with_validation_and_slug_uniqueness():
-    session = authenticate_admin()
+    session = get_admin_session()
 
     # Create initial strategic plan to update
     original_plan = {
@@ -1,42 +1,10 @@
-import requests
+# testsprite: serial
+# Uses fixed slug test-plan-for-deletion; must not overlap with another run of itself.
+from admin_session import BASE_URL, get_admin_session
 
-BASE_URL_AUTH = "http://localhost:3000/api/auth"
-BASE_URL_SP = "http://localhost:3000/api/strategic-plan"
+BASE_URL_SP = f"{BASE_URL}/api/strategic-plan"
 TIMEOUT = 30
 
-EMAIL = "admin@example.com"
-PASSWORD = "Admin@123456"
-
-
-def authenticate_admin():
-    session = requests.Session()
-    # Step a) Get CSRF token
-    r = session.get(f"{BASE_URL_AUTH}/csrf", timeout=TIMEOUT)
-    r.raise_for_status()
-    csrf_token = r.json().get("csrfToken")
-    assert csrf_token, "CSRF token not found in auth/csrf response"
-
-    # Step b) POST to credentials callback with form-data
-    data = {
-        "csrfToken": csrf_token,
-        "email": EMAIL,
-        "password": PASSWORD,
-        "json": "true",
-        "redirect": "false",
-    }
-    headers = {
-        "Content-Type": "application/x-www-form-urlencoded",
-    }
-    r = session.post(f"{BASE_URL_AUTH}/callback/credentials", data=data, headers=headers, timeout=TIMEOUT)
-    r.raise_for_status()
-    # Check if login was successful by presence of session cookie and response json success
-    assert r.status_code == 200, f"Login failed with status code {r.status_code}"
-    json_resp = r.json()
-    assert "ok" in json_resp or "url" in json_resp or "csrfToken" not in json_resp, "Login response unexpected"
-
-    # Session cookies are stored inside session
-    return session
-
 
 def create_strategic_plan(session):
     # Create a strategic plan used for delete testing
@@ -68,7 +36,7 @@ def delete_strategic_plan(session, plan_id):
 
 
 def test_admin_delete_strategic_plan():
-    session = authenticate_admin()
+    session = get_admin_session()
 
     plan_id = create_strategic_plan(session)
     try:
@@ -0,0 +1,205 @@
+"""
+Shared admin session for the testsprite admin tests (TC003-TC006).
+
+Logs in once per run (GET /api/auth/csrf, then POST /api/auth/callback/credentials),
+reuses one pooled keep-alive requests.Session for every admin request, caches the
+session cookies in a short-lived file so the next run can skip the login, and
+logs in again transparently when a request comes back 401.
+
+    from admin_session import get_admin_session
+
+    session = get_admin_session()  # or get_admin_session(base_url) for another server
+    r = session.get("http://localhost:3000/api/strategic-plan", timeout=30)
+
+Environment:
+    TESTSPRITE_BASE_URL        server under test (default http://localhost:3000)
+    TESTSPRITE_SESSION_CACHE   cookie cache file (default $XDG_CACHE_HOME or ~/.cache, then
+                               testsprite/admin-session-<server hash>.json); only trusted when it is
+                               a regular file owned by the current user and not readable by anyone else
+    TESTSPRITE_SESSION_TTL     seconds a cached cookie is trusted (default 900, 0 disables the cache)
+"""
+
+import hashlib
+import json
+import os
+import stat
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+BASE_URL = os.environ.get("TESTSPRITE_BASE_URL", "http://localhost:3000").rstrip("/")
+AUTH_URL = f"{BASE_URL}/api/auth"
+EMAIL = "admin@example.com"
+PASSWORD = "Admin@123456"
+TIMEOUT = 30
+
+# Auth.js v5 names (chunked as .0, .1, ... when large); next-auth v4 names for older servers
+SESSION_COOKIE_PREFIXES = (
+    "authjs.session-token",
+    "__Secure-authjs.session-token",
+    "next-auth.session-token",
+    "__Secure-next-auth.session-token",
+)
+# Per-user location: a predictable name in the shared temp dir could be planted by another user
+COOKIE_CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "testsprite")
+COOKIE_CACHE_FILE = os.environ.get("TESTSPRITE_SESSION_CACHE")  # one file for every server when set
+# Server-side JWT sessions last 2 hours; stay well inside that
+COOKIE_CACHE_TTL = int(os.environ.get("TESTSPRITE_SESSION_TTL", "900"))
+POOL_SIZE = 16
+
+
+def has_session_cookie(cookies):
+    return any(cookie.name.startswith(SESSION_COOKIE_PREFIXES) for cookie in cookies)
+
+
+class AdminSession(requests.Session):
+    """requests.Session that is logged in as the admin and re-authenticates on 401."""
+
+    def __init__(self, base_url=BASE_URL):
+        super().__init__()
+        self.base_url = base_url.rstrip("/")
+        self.auth_url = f"{self.base_url}/api/auth"
+        adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+        self._login_lock = threading.Lock()
+        self._generation = 0  # bumped on every login, so concurrent 401s log in only once
+
+    def login(self):
+        """Full credentials login; replaces any existing cookies."""
+        self.cookies.clear()
+        r = super().request("GET", f"{self.auth_url}/csrf", timeout=TIMEOUT)
+        r.raise_for_status()
+        csrf_token = r.json().get("csrfToken")
+        assert csrf_token, "CSRF token not found in auth/csrf response"
+
+        data = {
+            "csrfToken": csrf_token,
+            "email": EMAIL,
+            "password": PASSWORD,
+            "json": "true",
+            "redirect": "false",
+        }
+        headers = {"Content-Type": "application/x-www-form-urlencoded"}
+        r = super().request(
+            "POST", f"{self.auth_url}/callback/credentials", data=data, headers=headers, timeout=TIMEOUT, allow_redirects=False
+        )
+        if r.status_code >= 400:
+            r.raise_for_status()
+        assert has_session_cookie(self.cookies), f"Admin login failed, no session cookie received (status {r.status_code})"
+
+        self._generation += 1
+        save_cookies(self.cookies, self.base_url)
+
+    def is_authenticated(self):
+        """Cheap server-side check of the current cookies (no password hashing involved)."""
+        if not has_session_cookie(self.cookies):
+            return False
+        try:
+            r = super().request("GET", f"{self.auth_url}/session", timeout=TIMEOUT)
+            return r.status_code == 200 and bool((r.json() or {}).get("user"))
+        except (requests.RequestException, ValueError):
+            return False
+
+    def request(self, method, url, *args, **kwargs):
+        generation = self._generation
+        response = super().request(method, url, *args, **kwargs)
+        if response.status_code != 401 or url.startswith(self.auth_url):
+            return response
+
+        # Expired or revoked session: log in again (once for all threads) and retry
+        with self._login_lock:
+            if self._generation == generation:
+                self.login()
+        return super().request(method, url, *args, **kwargs)
+
+
+def _read_private_file(path):
+    """Contents of path if it is a regular file owned by the current user with no group/other access, else None."""
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+    except OSError:
+        return None
+    with os.fdopen(fd, "r", encoding="utf-8") as f:
+        st = os.fstat(f.fileno())
+        if not stat.S_ISREG(st.st_mode) or st.st_mode & 0o077:
+            return None
+        if hasattr(os, "getuid") and st.st_uid != os.getuid():
+            return None
+        return f.read()
+
+
+def cookie_cache_file(base_url=BASE_URL):
+    """Cookie cache path for a server: TESTSPRITE_SESSION_CACHE, or one file per base URL."""
+    if COOKIE_CACHE_FILE:
+        return COOKIE_CACHE_FILE
+    key = hashlib.sha1(base_url.rstrip("/").encode("utf-8")).hexdigest()[:12]
+    return os.path.join(COOKIE_CACHE_DIR, f"admin-session-{key}.json")
+
+
+def load_cookies(cookies, base_url=BASE_URL):
+    """Fill a cookie jar from the cache file; False when missing, untrusted, expired or for another server."""
+    if COOKIE_CACHE_TTL <= 0:
+        return False
+    base_url = base_url.rstrip("/")
+    try:
+        cached = json.loads(_read_private_file(cookie_cache_file(base_url)) or "null")
+    except (OSError, ValueError):
+        return False
+    if not isinstance(cached, dict):
+        return False
+    if cached.get("base_url") != base_url or time.time() - cached.get("saved_at", 0) > COOKIE_CACHE_TTL:
+        return False
+    for cookie in cached.get("cookies", []):
+        cookies.set(cookie["name"], cookie["value"], domain=cookie["domain"], path=cookie["path"])
+    return True
+
+
+def save_cookies(cookies, base_url=BASE_URL):
+    """Atomically write the session cookies to the server's cache file, readable by the current user only."""
+    if COOKIE_CACHE_TTL <= 0:
+        return
+    path = cookie_cache_file(base_url)
+    payload = {
+        "base_url": base_url.rstrip("/"),
+        "saved_at": time.time(),
+        "cookies": [
+            {"name": c.name, "value": c.value, "domain": c.domain, "path": c.path} for c in cookies
+        ],
+    }
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path) or ".", mode=0o700, exist_ok=True)
+        # O_EXCL: never write through a file or symlink someone else left at the temp path
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # the cache is an optimisation only
+
+
+def clear_cookie_cache(base_url=BASE_URL):
+    try:
+        os.remove(cookie_cache_file(base_url))
+    except OSError:
+        pass
+
+
+_sessions = {}  # base URL -> AdminSession
+_session_lock = threading.Lock()
+
+
+def get_admin_session(base_url=BASE_URL):
+    """The process-wide logged-in admin session for a server (cached cookies are reused when still valid)."""
+    base_url = base_url.rstrip("/")
+    with _session_lock:
+        session = _sessions.get(base_url)
+        if session is None:
+            session = AdminSession(base_url)
+            if not (load_cookies(session.cookies, base_url) and session.is_authenticated()):
+                session.login()
+            _sessions[base_url] = session
+        return session
@@ -0,0 +1,234 @@
+"""
+Cache-effectiveness benchmark for the public strategic-plan endpoints.
+
+Measures what the server-side cache (src/lib/cache.ts, Redis with an
+in-memory LRU fallback) saves on GET /api/strategic-plan/public and
+GET /api/strategic-plan/public/{id}, and checks that admin writes invalidate it.
+
+1. Probe: creates an inactive plan (unique cache-bench-* slug) through the admin API.
+2. Cold vs warm: each round PATCHes the probe, which deletes the list and item
+   cache keys, then times the first read (cold: database query + cache fill)
+   and --warm more reads (cache hits), for both endpoints.
+3. Revalidation: replays a warm read with If-None-Match / If-Modified-Since
+   when the response carries ETag / Last-Modified, and reports the outcome.
+4. Invalidation (TC005/TC006 flows): publishes the probe, renames it and
+   deletes it, polling the public list and item until each change is visible.
+   Any change not visible within --max-stale seconds fails the run.
+
+The probe is public for the few seconds of step 4 and is always deleted.
+
+Usage:
+    python testsprite_tests/bench_cache_strategic_plan.py [--rounds 20] [--warm 10] [--max-stale 2] [--json]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import uuid
+
+from load_strategic_plan import API_PREFIX, BASE_URL, HttpClient, percentile
+
+POLL_INTERVAL = 0.01
+
+
+def summarize(samples):
+    samples = sorted(samples)
+    return {
+        "n": len(samples),
+        "p50_ms": percentile(samples, 50),
+        "p95_ms": percentile(samples, 95),
+        "mean_ms": round(statistics.fmean(samples), 2) if samples else None,
+    }
+
+
+async def timed(client, method, path, body=None, headers=None):
+    start = time.perf_counter()
+    response = await client.request(method, path, body, headers)
+    return response, (time.perf_counter() - start) * 1000
+
+
+def _data(response):
+    return response.json().get("data") if response.status < 400 else None
+
+
+async def create_probe(client):
+    slug = f"cache-bench-{uuid.uuid4().hex[:12]}"
+    body = {"title": f"Cache benchmark {slug}", "slug": slug, "content": "Created by bench_cache_strategic_plan.py", "isActive": False}
+    response = await client.request("POST", API_PREFIX, body)
+    assert response.status == 201, f"Creating the probe plan failed: {response.status} {response.body[:200]!r}"
+    return response.json()["data"]
+
+
+async def cold_warm(client, probe, rounds, warm):
+    """Cold (first read after invalidation) and warm (repeat) latencies per endpoint."""
+    endpoints = {"list": f"{API_PREFIX}/public", "item": f"{API_PREFIX}/public/{probe['id']}"}
+    samples = {name: {"cold": [], "warm": []} for name in endpoints}
+    for i in range(rounds):
+        response = await client.request("PATCH", f"{API_PREFIX}/{probe['id']}", {"excerpt": f"round {i}"})
+        assert response.status == 200, f"PATCH for invalidation failed: {response.status}"
+        for name, path in endpoints.items():
+            response, ms = await timed(client, "GET", path)
+            assert response.status == 200, f"GET {path} returned {response.status}"
+            samples[name]["cold"].append(ms)
+            for _ in range(warm):
+                response, ms = await timed(client, "GET", path)
+                samples[name]["warm"].append(ms)
+
+    results = {}
+    for name, path in endpoints.items():
+        cold, warm_stats = summarize(samples[name]["cold"]), summarize(samples[name]["warm"])
+        saved = cold["p50_ms"] - warm_stats["p50_ms"]
+        results[name] = {
+            "path": path,
+            "cold": cold,
+            "warm": warm_stats,
+            # Median server time a cache hit avoids, and the share of a cold request it represents
+            "saved_ms_per_hit": round(saved, 2),
+            "saved_pct": round(100 * saved / cold["p50_ms"], 1) if cold["p50_ms"] else None,
+        }
+    return results
+
+
+async def revalidation(client, path):
+    """Conditional re-request of a warm response, when validators are present."""
+    response, _ = await timed(client, "GET", path)
+    result = {
+        "path": path,
+        "cache_control": response.headers.get("cache-control"),
+        "etag": response.headers.get("etag"),
+        "last_modified": response.headers.get("last-modified"),
+        "body_bytes": len(response.body),
+    }
+    for header, validator, key in (("If-None-Match", "etag", "if_none_match"),
+                                   ("If-Modified-Since", "last-modified", "if_modified_since")):
+        if not response.headers.get(validator):
+            result[key] = None
+            continue
+        conditional, ms = await timed(client, "GET", path, headers={header: response.headers[validator]})
+        result[key] = {"status": conditional.status, "latency_ms": round(ms, 2), "body_bytes": len(conditional.body)}
+    return result
+
+
+async def wait_until(client, path, check, max_stale):
+    """Milliseconds until check(response) holds after a write, or None if it never did within max_stale."""
+    start = time.perf_counter()
+    reads = 0
+    while True:
+        response = await client.request("GET", path)
+        reads += 1
+        elapsed = time.perf_counter() - start
+        if check(response):
+            return {"visible_after_ms": round(elapsed * 1000, 2), "reads": reads}
+        if elapsed > max_stale:
+            return {"visible_after_ms": None, "reads": reads}
+        await asyncio.sleep(POLL_INTERVAL)
+
+
+async def invalidation(client, probe, max_stale):
+    """How long public reads stay stale after publish, rename (PATCH) and DELETE."""
+    list_path, item_path = f"{API_PREFIX}/public", f"{API_PREFIX}/public/{probe['id']}"
+
+    def listed(title=None):
+        def check(response):
+            plans = _data(response) or []
+            return any(plan.get("id") == probe["id"] and (title is None or plan.get("title") == title) for plan in plans)
+        return check
+
+    # Warm both caches so every step has something to invalidate
+    await client.request("GET", list_path)
+    await client.request("GET", item_path)
+
+    steps = {}
+    await client.request("PATCH", f"{API_PREFIX}/{probe['id']}", {"isActive": True})
+    steps["publish"] = {"list": await wait_until(client, list_path, listed(), max_stale)}
+
+    title = f"{probe['title']} (renamed)"
+    await client.request("PATCH", f"{API_PREFIX}/{probe['id']}", {"title": title})
+    steps["patch"] = {
+        "list": await wait_until(client, list_path, listed(title), max_stale),
+        "item": await wait_until(client, item_path, lambda r: (_data(r) or {}).get("title") == title, max_stale),
+    }
+
+    response = await client.request("DELETE", f"{API_PREFIX}/{probe['id']}")
+    assert response.status == 200, f"DELETE failed: {response.status}"
+    steps["delete"] = {
+        "list": await wait_until(client, list_path, lambda r: not listed()(r), max_stale),
+        "item": await wait_until(client, item_path, lambda r: r.status == 404, max_stale),
+    }
+    return steps
+
+
+async def run(args):
+    from admin_session import get_admin_session  # the probe is created and changed through the admin API
+
+    admin = await asyncio.to_thread(get_admin_session, args.base_url)
+    client = HttpClient(args.base_url, max_connections=1)
+    client.cookie = "; ".join(f"{c.name}={c.value}" for c in admin.cookies)
+    probe = await create_probe(client)
+    deleted = False
+    try:
+        report = {
+            "base_url": args.base_url,
+            "rounds": args.rounds,
+            "warm_reads_per_round": args.warm,
+            "cold_warm": await cold_warm(client, probe, args.rounds, args.warm),
+            "revalidation": {
+                "list": await revalidation(client, f"{API_PREFIX}/public"),
+                "item": await revalidation(client, f"{API_PREFIX}/public/{probe['id']}"),
+            },
+        }
+        report["invalidation"] = await invalidation(client, probe, args.max_stale)
+        deleted = True
+    finally:
+        if not deleted:
+            await client.request("DELETE", f"{API_PREFIX}/{probe['id']}")
+        client.close()
+
+    checks = [check for step in report["invalidation"].values() for check in step.values()]
+    report["max_stale_s"] = args.max_stale
+    report["invalidation_ok"] = all(check["visible_after_ms"] is not None for check in checks)
+    return report
+
+
+def format_report(report):
+    lines = [f"{report['base_url']} - {report['rounds']} rounds, {report['warm_reads_per_round']} warm reads each", ""]
+    lines.append(f"{'endpoint':<10}{'cold p50':>10}{'warm p50':>10}{'cold p95':>10}{'warm p95':>10}{'saved/hit':>11}")
+    for name, result in report["cold_warm"].items():
+        lines.append(f"{name:<10}{result['cold']['p50_ms']:>8.1f}ms{result['warm']['p50_ms']:>8.1f}ms"
+                     f"{result['cold']['p95_ms']:>8.1f}ms{result['warm']['p95_ms']:>8.1f}ms"
+                     f"{result['saved_ms_per_hit']:>7.1f}ms ({result['saved_pct']}%)")
+    lines.append("")
+    for name, result in report["revalidation"].items():
+        validators = [key for key in ("etag", "last_modified") if result[key]]
+        outcome = ", ".join(f"{key}: {result[key]['status']} in {result[key]['latency_ms']}ms"
+                            for key in ("if_none_match", "if_modified_since") if result[key])
+        lines.append(f"revalidation {name}: Cache-Control={result['cache_control']!r}, "
+                     f"validators={validators or 'none'}{'; ' + outcome if outcome else ''}")
+    lines.append("")
+    for step, checks in report["invalidation"].items():
+        parts = [f"{target} {'STALE' if check['visible_after_ms'] is None else str(check['visible_after_ms']) + 'ms'}"
+                 f" ({check['reads']} reads)" for target, check in checks.items()]
+        lines.append(f"invalidation {step}: {', '.join(parts)}")
+    lines.append(f"-> {'OK' if report['invalidation_ok'] else 'FAILED'} (bound {report['max_stale_s']}s)")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cache-effectiveness benchmark for /api/strategic-plan/public")
+    parser.add_argument("--base-url", default=BASE_URL, help=f"Server under test (default: {BASE_URL})")
+    parser.add_argument("--rounds", type=int, default=20, help="Invalidate/cold/warm rounds (default: 20)")
+    parser.add_argument("--warm", type=int, default=10, help="Warm reads per round and endpoint (default: 10)")
+    parser.add_argument("--max-stale", type=float, default=2.0, help="Seconds a write may take to become visible (default: 2)")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+    return 0 if report["invalidation_ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,291 @@
+"""
+Concurrency and contention harness for innovator and collaborator registration.
+
+Fires many multipart POSTs at /api/innovators and /api/collaborator at once
+(the forms the public registration pages submit) and checks the uniqueness
+rules of TC003/TC004 and TC010/TC011 under contention:
+
+    unique   registrations with their own email and phone, all expected 201
+    email    races: --racers requests released together that share one email
+    phone    races: the same, sharing one phone number
+
+A race is clean when exactly one request wins with 201 and every other one
+gets a 4xx with the expected code (EMAIL_EXISTS / PHONE_EXISTS). More than one
+201 means duplicates were stored; any 5xx or transport error is a failure.
+Throughput and p50/p95/p99 latency are reported per resource and scenario.
+
+Registrations are real: they notify admins and send confirmation emails.
+Use a test server, and pass --cleanup to delete the created records through
+the admin API afterwards (needs requests, via admin_session).
+
+Usage:
+    python testsprite_tests/load_registration.py [--races 20] [--racers 10] [--unique 100] [--resources innovators,collaborator]
+    python testsprite_tests/load_registration.py --races 50 --racers 20 --cleanup --json > registration.json
+
+Exit status is 0 when every race was clean and no request failed.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import uuid
+from collections import Counter
+
+from load_strategic_plan import BASE_URL, HttpClient, Stats
+
+RESOURCES = {"innovators": "/api/innovators", "collaborator": "/api/collaborator"}
+EXPECTED_CODES = {"email": "EMAIL_EXISTS", "phone": "PHONE_EXISTS"}
+
+
+def encode_multipart(fields):
+    """multipart/form-data body and Content-Type header for a dict of text fields."""
+    boundary = f"----testsprite{uuid.uuid4().hex}"
+    parts = []
+    for name, value in fields.items():
+        parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n')
+    parts.append(f"--{boundary}--\r\n")
+    return "".join(parts).encode("utf-8"), f"multipart/form-data; boundary={boundary}"
+
+
+class Identities:
+    """Emails and phone numbers unique to this run (the phone regex is ^\\+[\\d\\s-]{6,15}$)."""
+
+    def __init__(self, seed=None):
+        rng = random.Random(seed)
+        self.run = uuid.UUID(int=rng.getrandbits(128)).hex[:8]
+        self.phone_prefix = f"+9{rng.randrange(10 ** 4):04d}"
+        self.counter = 0
+
+    def next(self):
+        self.counter += 1
+        return f"race-{self.run}-{self.counter}@example.com", f"{self.phone_prefix}{self.counter:07d}"
+
+
+def form(resource, email, phone, label):
+    if resource == "innovators":
+        return {
+            "name": f"Load Innovator {label}",
+            "email": email,
+            "phoneNumber": phone,
+            "country": "USA",
+            "city": "Boston",
+            "specialization": "Artificial Intelligence",
+            "projectTitle": f"Load Project {label}",
+            "projectDescription": "Created by load_registration.py",
+            "TermsOfUse": "true",
+        }
+    return {
+        "companyName": f"Load Company {label}",
+        "email": email,
+        "primaryPhoneNumber": phone,
+        "industrialSector": "Technology",
+        "specialization": "Software Development",
+        "location": "Riyadh, Saudi Arabia",
+        "site": "https://example.com",
+        "TermsOfUse": "true",
+    }
+
+
+def build_groups(resource, scenario, count, racers, identities):
+    """Lists of form dicts; each list is released at once. Races share one field within a group."""
+    if scenario == "unique":
+        return [[form(resource, *identities.next(), f"{identities.run}-u{i}")] for i in range(count)]
+    groups = []
+    for race in range(count):
+        shared_email, shared_phone = identities.next()
+        group = []
+        for racer in range(racers):
+            email, phone = identities.next()
+            if scenario == "email":
+                email = shared_email
+            else:
+                phone = shared_phone
+            group.append(form(resource, email, phone, f"{identities.run}-{scenario}{race}-{racer}"))
+        groups.append(group)
+    return groups
+
+
+class RegistrationLoad:
+    def __init__(self, client):
+        self.client = client
+        self.stats = Stats()
+        self.created = []  # (resource, id) of every 201
+        self.races = []
+        self.failures = Counter()  # unique registrations that did not get 201, by status/code
+
+    async def _post(self, route, resource, fields):
+        body, content_type = encode_multipart(fields)
+        started = time.perf_counter()
+        try:
+            response = await self.client.request("POST", RESOURCES[resource], body, {"Content-Type": content_type})
+        except Exception as e:
+            self.stats.record(route, started, error=e)
+            return None, None
+        self.stats.record(route, started, response.status)
+        try:
+            payload = response.json() or {}
+        except ValueError:
+            payload = {}
+        if response.status == 201 and (payload.get("data") or {}).get("id"):
+            self.created.append((resource, payload["data"]["id"]))
+        return response.status, payload.get("code")
+
+    async def _group(self, release, resource, scenario, fields_list):
+        route = f"{resource} {scenario}"
+        await release.wait()
+        outcomes = await asyncio.gather(*(self._post(route, resource, fields) for fields in fields_list))
+        if scenario == "unique":
+            for status, code in outcomes:
+                if status != 201:
+                    self.failures[f"{status or 'error'} {code or ''}".strip()] += 1
+            return
+        self.races.append(judge_race(resource, scenario, outcomes))
+
+    async def run(self, groups):
+        """Release every group at the same moment; the connection pool bounds real parallelism."""
+        release = asyncio.Event()
+        tasks = [asyncio.create_task(self._group(release, resource, scenario, fields_list))
+                 for resource, scenario, fields_list in groups]
+        await asyncio.sleep(0)
+        start = time.perf_counter()
+        release.set()
+        await asyncio.gather(*tasks)
+        return time.perf_counter() - start
+
+
+def judge_race(resource, scenario, outcomes):
+    statuses = Counter(str(status or "error") for status, _ in outcomes)
+    codes = Counter(code for status, code in outcomes if status and 400 <= status < 500)
+    winners = statuses.get("201", 0)
+    server_errors = sum(count for status, count in statuses.items() if status == "error" or status.startswith("5"))
+    unexpected_codes = sum(count for code, count in codes.items() if code != EXPECTED_CODES[scenario])
+    if server_errors:
+        verdict = "server_error"
+    elif winners > 1:
+        verdict = "multiple_winners"
+    elif winners == 0:
+        verdict = "no_winner"
+    elif unexpected_codes or winners + sum(codes.values()) != len(outcomes):
+        verdict = "unexpected_response"
+    else:
+        verdict = "clean"
+    return {"resource": resource, "scenario": scenario, "verdict": verdict,
+            "status": dict(sorted(statuses.items())), "codes": dict(codes)}
+
+
+async def cleanup(base_url, created):
+    """Delete every created registration through the admin API; returns the number not deleted."""
+    from admin_session import TIMEOUT, get_admin_session  # requests is only needed for --cleanup
+
+    def delete_all():
+        session = get_admin_session(base_url)
+        failed = 0
+        for resource, record_id in created:
+            response = session.delete(f"{base_url}{RESOURCES[resource]}/{record_id}", timeout=TIMEOUT)
+            failed += response.status_code >= 400
+        return failed
+
+    return await asyncio.to_thread(delete_all)
+
+
+async def run(args):
+    identities = Identities(args.seed)
+    groups = []
+    for resource in args.resources:
+        groups += [(resource, "unique", group) for group in build_groups(resource, "unique", args.unique, 1, identities)]
+        for scenario in ("email", "phone"):
+            groups += [(resource, scenario, group) for group in build_groups(resource, scenario, args.races, args.racers, identities)]
+
+    client = HttpClient(args.base_url, max_connections=args.max_connections)
+    load = RegistrationLoad(client)
+    try:
+        elapsed = await load.run(groups)
+    finally:
+        client.close()
+
+    report = load.stats.report(elapsed)
+    del report["skipped_arrivals"]  # closed burst, nothing is skipped
+    verdicts = Counter((race["resource"], race["scenario"], race["verdict"]) for race in load.races)
+    report["races"] = {
+        f"{resource} {scenario}": {verdict: count for (r, s, verdict), count in sorted(verdicts.items()) if (r, s) == (resource, scenario)}
+        for resource in args.resources for scenario in ("email", "phone")
+    }
+    report["dirty_races"] = [race for race in load.races if race["verdict"] != "clean"]
+    report["unique_failures"] = dict(load.failures)
+    report["created"] = len(load.created)
+    report["config"] = {
+        "base_url": args.base_url,
+        "resources": args.resources,
+        "races": args.races,
+        "racers": args.racers,
+        "unique": args.unique,
+        "max_connections": args.max_connections,
+        "run": identities.run,
+    }
+    if args.cleanup:
+        report["cleanup_failed"] = await cleanup(args.base_url, load.created)
+    return report
+
+
+def format_report(report):
+    config = report["config"]
+    lines = [
+        f"{config['base_url']} - {report['requests']} registrations in {report['elapsed_s']}s ({report['rps']} req/s), "
+        f"{config['races']} races x {config['racers']} racers per field and resource, run {config['run']}",
+        "",
+        f"{'scenario':<24}{'reqs':>7}{'rps':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}  status",
+    ]
+    for route, stats in report["routes"].items():
+        status = " ".join(f"{code}:{count}" for code, count in stats["status"].items())
+        errors = " ".join(f"{name}:{count}" for name, count in stats["errors"].items())
+        lines.append(
+            f"{route:<24}{stats['requests']:>7}{stats['rps']:>9.1f}{stats['p50_ms']:>9.1f}"
+            f"{stats['p95_ms']:>9.1f}{stats['p99_ms']:>9.1f}  {status} {errors}".rstrip()
+        )
+    lines.append("")
+    for name, verdicts in report["races"].items():
+        lines.append(f"races {name:<20}" + " ".join(f"{verdict}:{count}" for verdict, count in verdicts.items()))
+    for race in report["dirty_races"][:10]:
+        lines.append(f"  {race['resource']} {race['scenario']} {race['verdict']}: status {race['status']} codes {race['codes']}")
+    if len(report["dirty_races"]) > 10:
+        lines.append(f"  ... {len(report['dirty_races']) - 10} more")
+    if report["unique_failures"]:
+        lines.append(f"unique registrations not created: {report['unique_failures']}")
+    lines.append(f"created {report['created']} records" + (
+        f", cleanup failed for {report['cleanup_failed']}" if report.get("cleanup_failed") else
+        ", cleaned up" if "cleanup_failed" in report else ""))
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Registration concurrency and contention harness")
+    parser.add_argument("--base-url", default=BASE_URL, help=f"Server under test (default: {BASE_URL})")
+    parser.add_argument("--resources", default=",".join(RESOURCES), help="Comma-separated endpoints (default: innovators,collaborator)")
+    parser.add_argument("--races", type=int, default=20, help="Races per field (email, phone) and resource (default: 20)")
+    parser.add_argument("--racers", type=int, default=10, help="Concurrent requests per race (default: 10)")
+    parser.add_argument("--unique", type=int, default=100, help="Non-colliding registrations per resource (default: 100)")
+    parser.add_argument("--max-connections", type=int, default=200, help="Concurrent connections (default: 200)")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for the run's emails and phone numbers")
+    parser.add_argument("--cleanup", action="store_true", help="Delete the created records through the admin API")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    args.resources = [name.strip() for name in args.resources.split(",") if name.strip()]
+    unknown = [name for name in args.resources if name not in RESOURCES]
+    if unknown or not args.resources:
+        parser.error(f"--resources expects some of {', '.join(RESOURCES)}")
+    if args.racers < 2:
+        parser.error("--racers must be at least 2")
+
+    report = asyncio.run(run(args))
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+    transport_errors = sum(sum(stats["errors"].values()) for stats in report["routes"].values())
+    failed = report["dirty_races"] or report["unique_failures"] or transport_errors or report.get("cleanup_failed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,376 @@
+"""
+Async load generator for the strategic-plan API.
+
+Replays a weighted mix of the routes covered by TC001-TC006 against a running
+server and reports throughput, p50/p95/p99 latency and a status-code histogram
+per route. Uses only asyncio and a small keep-alive HTTP/1.1 client, so it
+needs nothing beyond the standard library (plus requests for the admin login,
+which goes through admin_session).
+
+Operations (weights via --mix):
+    public_list   GET    /api/strategic-plan/public
+    public_item   GET    /api/strategic-plan/public/{id or slug}
+    admin_list    GET    /api/strategic-plan
+    admin_crud    POST   /api/strategic-plan, PATCH /{id}, DELETE /{id}
+                  (inactive plans with unique load-* slugs, always deleted)
+
+Usage:
+    python testsprite_tests/load_strategic_plan.py --concurrency 32 --duration 30
+    python testsprite_tests/load_strategic_plan.py --rps 200 --duration 60 --mix public_list=70,public_item=30
+    python testsprite_tests/load_strategic_plan.py --json > load.json
+
+--concurrency runs a closed loop (N workers back to back); --rps an open loop
+that starts operations on a fixed schedule, skipping (and counting) arrivals
+while --max-in-flight operations are already running.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import ssl
+import sys
+import time
+import uuid
+from collections import Counter, defaultdict
+from urllib.parse import urlsplit
+
+# Same default and override as admin_session, without importing requests for public-only runs
+BASE_URL = os.environ.get("TESTSPRITE_BASE_URL", "http://localhost:3000").rstrip("/")
+API_PREFIX = "/api/strategic-plan"
+DEFAULT_MIX = "public_list=60,public_item=30,admin_list=5,admin_crud=5"
+OPERATIONS = ("public_list", "public_item", "admin_list", "admin_crud")
+ADMIN_OPERATIONS = ("admin_list", "admin_crud")
+REQUEST_TIMEOUT = 30
+
+
+class Response:
+    def __init__(self, status, headers, body):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def json(self):
+        return json.loads(self.body or b"null")
+
+
+class HttpClient:
+    """Minimal asyncio HTTP/1.1 client with a pool of keep-alive connections."""
+
+    def __init__(self, base_url, max_connections=100):
+        parts = urlsplit(base_url)
+        self.base_url = base_url.rstrip("/")
+        self.host = parts.hostname
+        self.ssl = ssl.create_default_context() if parts.scheme == "https" else None
+        self.port = parts.port or (443 if self.ssl else 80)
+        self.host_header = parts.netloc
+        self.cookie = None
+        self._idle = []
+        self._slots = asyncio.Semaphore(max_connections)
+
+    async def request(self, method, path, body=None, headers=None):
+        """Send one request; a dead reused connection is retried once on a fresh one."""
+        async with self._slots:
+            for attempt in range(2):
+                reused = bool(self._idle)
+                reader, writer = self._idle.pop() if reused else await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+                try:
+                    response, keep_alive = await asyncio.wait_for(
+                        self._exchange(reader, writer, method, path, body, headers), REQUEST_TIMEOUT
+                    )
+                except (ConnectionError, asyncio.IncompleteReadError) as e:
+                    writer.close()
+                    if reused and attempt == 0:
+                        continue
+                    raise ConnectionError(f"{method} {path}: {e!r}") from e
+                except BaseException:
+                    writer.close()
+                    raise
+                if keep_alive:
+                    self._idle.append((reader, writer))
+                else:
+                    writer.close()
+                return response
+
+    async def _exchange(self, reader, writer, method, path, body, extra_headers=None):
+        # bytes are sent as-is (Content-Type comes with the extra headers), anything else as JSON
+        raw = isinstance(body, bytes)
+        payload = body if raw else json.dumps(body).encode("utf-8") if body is not None else b""
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self.host_header}", "Accept: application/json",
+                 f"Content-Length: {len(payload)}"]
+        if body is not None and not raw:
+            lines.append("Content-Type: application/json")
+        if self.cookie:
+            lines.append(f"Cookie: {self.cookie}")
+        lines += [f"{name}: {value}" for name, value in (extra_headers or {}).items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + payload)
+        await writer.drain()
+
+        status_line = await reader.readuntil(b"\r\n")
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = await reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        keep_alive = headers.get("connection", "").lower() != "close"
+        if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            data = b""
+        elif headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                if size == 0:
+                    while await reader.readuntil(b"\r\n") != b"\r\n":
+                        pass  # trailers
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            data = b"".join(chunks)
+        elif "content-length" in headers:
+            data = await reader.readexactly(int(headers["content-length"]))
+        else:
+            data, keep_alive = await reader.read(), False
+        return Response(status, headers, data), keep_alive
+
+    def close(self):
+        for _, writer in self._idle:
+            writer.close()
+        self._idle.clear()
+
+
+class Stats:
+    """Per-route latency samples, status histograms and transport errors."""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.statuses = defaultdict(Counter)
+        self.errors = defaultdict(Counter)
+        self.skipped = 0
+
+    def record(self, route, started, status=None, error=None):
+        self.latencies[route].append((time.perf_counter() - started) * 1000)
+        if error is not None:
+            self.errors[route][type(error).__name__] += 1
+        else:
+            self.statuses[route][str(status)] += 1
+
+    def report(self, elapsed):
+        routes = {}
+        for route in sorted(self.latencies):
+            samples = sorted(self.latencies[route])
+            routes[route] = {
+                "requests": len(samples),
+                "rps": round(len(samples) / elapsed, 2),
+                "p50_ms": percentile(samples, 50),
+                "p95_ms": percentile(samples, 95),
+                "p99_ms": percentile(samples, 99),
+                "max_ms": round(samples[-1], 2),
+                "status": dict(sorted(self.statuses[route].items())),
+                "errors": dict(self.errors[route]),
+            }
+        total = sum(route["requests"] for route in routes.values())
+        return {
+            "elapsed_s": round(elapsed, 2),
+            "requests": total,
+            "rps": round(total / elapsed, 2) if elapsed else 0,
+            "skipped_arrivals": self.skipped,
+            "routes": routes,
+        }
+
+
+def percentile(sorted_samples, pct):
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_samples:
+        return None
+    rank = max(1, -(-pct * len(sorted_samples) // 100))
+    return round(sorted_samples[int(rank) - 1], 2)
+
+
+def parse_mix(text):
+    mix = {}
+    for item in filter(None, (part.strip() for part in text.split(","))):
+        name, _, weight = item.partition("=")
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation {name!r}; expected one of {', '.join(OPERATIONS)}")
+        mix[name] = float(weight or 1)
+    if not any(weight > 0 for weight in mix.values()):
+        raise ValueError("--mix needs at least one positive weight")
+    return mix
+
+
+class LoadTest:
+    def __init__(self, client, mix, seed=None):
+        self.client = client
+        self.stats = Stats()
+        self.names = [name for name, weight in mix.items() if weight > 0]
+        self.weights = [mix[name] for name in self.names]
+        self.rng = random.Random(seed)
+        self.targets = []  # ids and slugs of public plans
+        self._admin = None
+        self._login_lock = asyncio.Lock()
+        self._login_generation = 0
+
+    async def setup(self):
+        """Log in when admin routes are in the mix and collect public ids/slugs for public_item."""
+        if any(name in ADMIN_OPERATIONS for name in self.names):
+            from admin_session import get_admin_session  # requests is only needed for admin routes
+
+            # Log in to the server under test, not admin_session's default BASE_URL
+            self._admin = await asyncio.to_thread(get_admin_session, self.client.base_url)
+            self._use_admin_cookies()
+        response = await self.client.request("GET", f"{API_PREFIX}/public")
+        if response.status == 200:
+            plans = response.json().get("data") or []
+            self.targets = [value for plan in plans for value in (plan.get("id"), plan.get("slug")) if value]
+        if "public_item" in self.names and not self.targets:
+            print("warning: no public strategic plans; public_item will request a missing slug (404)", file=sys.stderr)
+
+    def _use_admin_cookies(self):
+        self.client.cookie = "; ".join(f"{c.name}={c.value}" for c in self._admin.cookies)
+
+    async def _call(self, route, method, path, body=None):
+        generation = self._login_generation
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, path, body)
+        except Exception as e:
+            self.stats.record(route, started, error=e)
+            return None
+        self.stats.record(route, started, response.status)
+        if response.status == 401 and self._admin is not None:
+            async with self._login_lock:
+                if generation == self._login_generation:
+                    await asyncio.to_thread(self._admin.login)
+                    self._use_admin_cookies()
+                    self._login_generation += 1
+        return response
+
+    async def public_list(self):
+        await self._call("GET /public", "GET", f"{API_PREFIX}/public")
+
+    async def public_item(self):
+        target = self.rng.choice(self.targets) if self.targets else "load-missing-plan"
+        await self._call("GET /public/{id}", "GET", f"{API_PREFIX}/public/{target}")
+
+    async def admin_list(self):
+        await self._call("GET /", "GET", API_PREFIX)
+
+    async def admin_crud(self):
+        slug = f"load-{uuid.uuid4().hex[:12]}"
+        body = {"title": f"Load test {slug}", "slug": slug, "content": "Created by load_strategic_plan.py", "isActive": False}
+        response = await self._call("POST /", "POST", API_PREFIX, body)
+        if response is None or response.status != 201:
+            return
+        plan_id = (response.json().get("data") or {}).get("id")
+        if not plan_id:
+            return
+        await self._call("PATCH /{id}", "PATCH", f"{API_PREFIX}/{plan_id}", {"title": f"Load test {slug} (updated)"})
+        await self._call("DELETE /{id}", "DELETE", f"{API_PREFIX}/{plan_id}")
+
+    async def one(self):
+        await getattr(self, self.rng.choices(self.names, self.weights)[0])()
+
+    async def run_closed(self, concurrency, duration):
+        deadline = time.perf_counter() + duration
+
+        async def worker():
+            while time.perf_counter() < deadline:
+                await self.one()
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    async def run_open(self, rps, duration, max_in_flight):
+        start = time.perf_counter()
+        in_flight = set()
+        for i in range(int(rps * duration)):
+            delay = start + i / rps - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if len(in_flight) >= max_in_flight:
+                self.stats.skipped += 1
+                continue
+            task = asyncio.create_task(self.one())
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        if in_flight:
+            await asyncio.gather(*in_flight)
+
+
+async def run(args):
+    client = HttpClient(args.base_url, max_connections=args.max_connections)
+    load = LoadTest(client, parse_mix(args.mix), args.seed)
+    try:
+        await load.setup()
+        start = time.perf_counter()
+        if args.rps:
+            await load.run_open(args.rps, args.duration, args.max_in_flight)
+        else:
+            await load.run_closed(args.concurrency, args.duration)
+        elapsed = time.perf_counter() - start
+    finally:
+        client.close()
+    report = load.stats.report(elapsed)
+    report["config"] = {
+        "base_url": args.base_url,
+        "mode": "open" if args.rps else "closed",
+        "rps": args.rps,
+        "concurrency": None if args.rps else args.concurrency,
+        "duration_s": args.duration,
+        "mix": parse_mix(args.mix),
+    }
+    return report
+
+
+def format_report(report):
+    config = report["config"]
+    target = f"{config['rps']} rps" if config["mode"] == "open" else f"{config['concurrency']} workers"
+    lines = [
+        f"{config['base_url']} - {target} for {config['duration_s']}s: "
+        f"{report['requests']} requests in {report['elapsed_s']}s ({report['rps']} req/s)",
+    ]
+    if report["skipped_arrivals"]:
+        lines.append(f"skipped arrivals (max in flight reached): {report['skipped_arrivals']}")
+    lines.append("")
+    lines.append(f"{'route':<18}{'reqs':>7}{'rps':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}  status")
+    for route, stats in report["routes"].items():
+        status = " ".join(f"{code}:{count}" for code, count in stats["status"].items())
+        errors = " ".join(f"{name}:{count}" for name, count in stats["errors"].items())
+        lines.append(
+            f"{route:<18}{stats['requests']:>7}{stats['rps']:>9.1f}{stats['p50_ms']:>9.1f}"
+            f"{stats['p95_ms']:>9.1f}{stats['p99_ms']:>9.1f}  {status} {errors}".rstrip()
+        )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load generator for /api/strategic-plan")
+    parser.add_argument("--base-url", default=BASE_URL, help=f"Server under test (default: {BASE_URL})")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--concurrency", "-c", type=int, default=16, help="Closed loop: concurrent workers (default: 16)")
+    mode.add_argument("--rps", type=float, default=None, help="Open loop: operations started per second")
+    parser.add_argument("--duration", "-d", type=float, default=30, help="Seconds to run (default: 30)")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"Operation weights (default: {DEFAULT_MIX})")
+    parser.add_argument("--max-in-flight", type=int, default=256, help="Open loop: cap on concurrent operations (default: 256)")
+    parser.add_argument("--max-connections", type=int, default=100, help="Keep-alive connection pool size (default: 100)")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for the operation mix")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    try:
+        parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    report = asyncio.run(run(args))
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+    errors = sum(sum(stats["errors"].values()) for stats in report["routes"].values())
+    return 1 if errors or not report["requests"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
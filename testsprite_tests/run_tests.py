@@ -0,0 +1,186 @@
+"""
+Parallel runner for the testsprite API checks.
+
+Each TC*.py script runs its checks at import time, so every test is executed
+as its own Python process (cwd = the script's directory). Independent tests
+run across a worker pool; tests declared serial run afterwards, one at a time,
+with nothing else in flight. Results are written in the shape of
+tmp/test_results.json.
+
+A test is serial when its file contains the line
+
+    # testsprite: serial
+
+(e.g. it uses a fixed slug such as `test-plan-for-deletion`), or when it
+matches a --serial pattern.
+
+Usage:
+    python testsprite_tests/run_tests.py [-j 8] [--timeout 120] [-k delete] [--serial 'registration/TC01*'] [-o report.json]
+
+Exit status is 0 when every selected test passed.
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import subprocess
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+TESTS_DIR = Path(__file__).resolve().parent
+DEFAULT_REPORT = TESTS_DIR / "tmp" / "runner_results.json"
+DEFAULT_TIMEOUT = 120
+SERIAL_MARKER = "# testsprite: serial"
+TEST_PLAN_FILE = "testsprite_backend_test_plan.json"
+
+_descriptions = {}  # directory -> {TC id: description}
+
+
+def discover(pattern=None):
+    """All TC*.py scripts under testsprite_tests, optionally filtered by a substring of their path."""
+    tests = sorted(TESTS_DIR.rglob("TC*.py"), key=lambda p: p.relative_to(TESTS_DIR).as_posix())
+    tests = [p for p in tests if "tmp" not in p.relative_to(TESTS_DIR).parts]
+    if pattern:
+        tests = [p for p in tests if pattern in p.relative_to(TESTS_DIR).as_posix()]
+    return tests
+
+
+def is_serial(path, serial_patterns):
+    relpath = path.relative_to(TESTS_DIR).as_posix()
+    if any(fnmatch.fnmatch(relpath, pattern) or fnmatch.fnmatch(path.name, pattern) for pattern in serial_patterns):
+        return True
+    with open(path, "r", encoding="utf-8") as f:
+        return any(line.strip() == SERIAL_MARKER for line in f)
+
+
+def load_descriptions(directory):
+    """TC id -> description from the test plan next to the scripts, if any."""
+    if directory not in _descriptions:
+        try:
+            with open(directory / TEST_PLAN_FILE, "r", encoding="utf-8") as f:
+                _descriptions[directory] = {item["id"]: item.get("description", "") for item in json.load(f)}
+        except (OSError, ValueError, KeyError, TypeError):
+            _descriptions[directory] = {}
+    return _descriptions[directory]
+
+
+def _env():
+    """Child environment: shared helpers such as admin_session importable from every subdirectory."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(TESTS_DIR), env.get("PYTHONPATH")]))
+    env["PYTHONUNBUFFERED"] = "1"
+    return env
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def run_test(path, timeout):
+    """Run one script in its own process and return a report entry."""
+    relpath = path.relative_to(TESTS_DIR).as_posix()
+    test_id, _, name = path.stem.partition("_")
+    created = _now()
+    start = time.perf_counter()
+    try:
+        proc = subprocess.run(
+            [sys.executable, path.name], cwd=path.parent, env=_env(),
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, timeout=timeout,
+        )
+        status = "PASSED" if proc.returncode == 0 else "FAILED"
+        error = "" if proc.returncode == 0 else proc.stdout or f"Exited with status {proc.returncode}"
+    except subprocess.TimeoutExpired as e:
+        output = e.stdout.decode("utf-8", "replace") if isinstance(e.stdout, bytes) else (e.stdout or "")
+        status, error = "FAILED", f"{output}\nTimed out after {timeout}s".lstrip()
+    duration_ms = round((time.perf_counter() - start) * 1000, 1)
+
+    with open(path, "r", encoding="utf-8") as f:
+        code = f.read()
+    return {
+        "testId": str(uuid.uuid5(uuid.NAMESPACE_URL, relpath)),
+        "title": f"{test_id}-{name}",
+        "path": relpath,
+        "description": load_descriptions(path.parent).get(test_id, ""),
+        "code": code,
+        "testStatus": status,
+        "testError": error,
+        "testType": "BACKEND",
+        "createFrom": "local",
+        "durationMs": duration_ms,
+        "created": created,
+        "modified": _now(),
+    }
+
+
+def warm_admin_session(tests):
+    """Log in once before the pool starts, so workers reuse the cached admin cookie."""
+    if not any("admin_session" in path.read_text(encoding="utf-8") for path in tests):
+        return
+    proc = subprocess.run(
+        [sys.executable, "-c", "from admin_session import get_admin_session; get_admin_session()"],
+        cwd=TESTS_DIR, env=_env(), stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+    )
+    if proc.returncode != 0:
+        last_line = (proc.stdout.strip().splitlines() or ["unknown error"])[-1]
+        print(f"warning: admin login failed before the run ({last_line}); tests will log in themselves", file=sys.stderr)
+
+
+def _print_result(result):
+    print(f"{result['testStatus']:<7} {result['durationMs'] / 1000:7.2f}s  {result['path']}", flush=True)
+
+
+def run_all(tests, jobs, timeout, serial_patterns=()):
+    """Parallel tests first (in discovery order in the report), then serial ones one by one."""
+    serial = [path for path in tests if is_serial(path, serial_patterns)]
+    parallel = [path for path in tests if path not in serial]
+    warm_admin_session(tests)
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        futures = {path: pool.submit(run_test, path, timeout) for path in parallel}
+        for path, future in futures.items():
+            results[path] = future.result()
+            _print_result(results[path])
+    for path in serial:
+        results[path] = run_test(path, timeout)
+        _print_result(results[path])
+    return [results[path] for path in tests]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run testsprite API checks in parallel")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 4, help="Worker processes (default: CPU count)")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help=f"Per-test timeout in seconds (default: {DEFAULT_TIMEOUT})")
+    parser.add_argument("-k", dest="pattern", default=None, help="Only run tests whose path contains this string")
+    parser.add_argument("--serial", action="append", default=[], metavar="GLOB", help="Also run matching tests serially (repeatable)")
+    parser.add_argument("-o", "--output", default=str(DEFAULT_REPORT), help=f"Report file (default: {DEFAULT_REPORT.relative_to(TESTS_DIR.parent)})")
+    args = parser.parse_args()
+
+    tests = discover(args.pattern)
+    if not tests:
+        print("No tests found", file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    results = run_all(tests, args.jobs, args.timeout, args.serial)
+    elapsed = time.perf_counter() - start
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+
+    failed = sum(1 for result in results if result["testStatus"] != "PASSED")
+    serial_seconds = sum(result["durationMs"] for result in results) / 1000
+    print(f"\n{len(results) - failed} passed, {failed} failed in {elapsed:.2f}s "
+          f"(sum of test durations {serial_seconds:.2f}s) -> {output}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())